@@ -0,0 +1,189 @@
+# contest_model.py - 공모전 레코드 타입과 DataFrame 변환
+import hashlib
+import unicodedata
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional, Dict, Iterable, Tuple
+import numpy as np
+import pandas as pd
+from contest_rules import NO_HOST_TEXT, NO_PERIOD_TEXT, NO_PRIZE_TEXT, prize_amounts, normalize_contest_link
+
+# 레코드 속성 → DataFrame 열 이름
+COLUMN_NAMES = {
+    'title': '제목',
+    'host': '주최',
+    'period': '기간',
+    'deadline': '마감일',
+    'prize': '상금',
+    'link': '링크',
+}
+CONTEST_COLUMNS = list(COLUMN_NAMES.values())
+
+# 같은 값(주최 기관, 자리표시 문자열)이 반복되는 열은 범주형으로 저장
+CATEGORY_COLUMNS = ('주최', '기간', '상금')
+
+# 정렬 기준 → (정렬 키, 내림차순 여부)
+SORT_OPTIONS = {
+    "마감 임박순": ('deadline', False),  # 마감일 없는 공모전은 마지막
+    "신규 등록순": ('deadline', True),   # 마감일이 먼 순 (마감일 없는 공모전이 먼저)
+    "제목 순": ('title', False),
+    "상금 높은순": ('prize', True),    # 상금 정보 없는 공모전(0원)은 마지막
+}
+
+@dataclass(slots=True)
+class Contest:
+    """목록에서 추출한 공모전 하나
+
+    __slots__ 레코드라 dict보다 작고, 정보가 없는 필드는 같은 자리표시 문자열 객체를 공유합니다.
+    """
+    title: str
+    link: str
+    host: str = NO_HOST_TEXT
+    period: str = NO_PERIOD_TEXT
+    deadline: Optional[date] = None
+    prize: str = NO_PRIZE_TEXT
+
+    def to_dict(self) -> Dict:
+        """한글 열 이름('제목', '링크' 등)의 dict로 변환"""
+        return {column: getattr(self, name) for name, column in COLUMN_NAMES.items()}
+
+    def to_tuple(self) -> Tuple:
+        """필드 순서의 튜플로 변환 (Contest(*row)로 복원, 프로세스 간 전달용)"""
+        return (self.title, self.link, self.host, self.period, self.deadline, self.prize)
+
+    @classmethod
+    def from_dict(cls, record) -> 'Contest':
+        """한글 열 이름의 dict/Series에서 생성"""
+        deadline = record.get('마감일')
+        if deadline is None or pd.isna(deadline):
+            deadline = None
+        elif isinstance(deadline, datetime):
+            deadline = deadline.date()
+        return cls(
+            title=record['제목'],
+            link=record['링크'],
+            host=record.get('주최') or NO_HOST_TEXT,
+            period=record.get('기간') or NO_PERIOD_TEXT,
+            deadline=deadline,
+            prize=record.get('상금') or NO_PRIZE_TEXT,
+        )
+
+def contest_id(link: str) -> str:
+    """링크로 만든 고정 공모전 ID (검색 위치, 프로세스, 재시작과 관계없이 같은 공모전이면 같은 값)"""
+    return hashlib.sha1(normalize_contest_link(link).encode('utf-8')).hexdigest()[:16]
+
+def build_contest_frame(contests: Iterable[Contest], **extra_columns) -> pd.DataFrame:
+    """Contest 목록으로 열 단위 DataFrame 생성 (as_contest_frame의 dtype 적용)
+
+    extra_columns로 레코드와 같은 길이의 열(예: matched_keywords)을 추가할 수 있습니다.
+    contest_id가 같은 레코드는 처음 것만 남깁니다 (대시보드 위젯 키가 contest_id 기준).
+    """
+    contests = list(contests)
+    data = {column: [getattr(contest, name) for contest in contests] for name, column in COLUMN_NAMES.items()}
+    data.update(extra_columns)
+    df = as_contest_frame(pd.DataFrame(data))
+    duplicated = df['contest_id'].duplicated()
+    if duplicated.any():
+        df = df[~duplicated].reset_index(drop=True)
+    return df
+
+def as_contest_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """공모전 DataFrame의 dtype 정리
+
+    마감일은 datetime64(없으면 NaT), 주최/기간/상금은 범주형으로 바꾸고
+    상금 텍스트로부터 숫자 상금액 열 '상금_원'(int64)을, 링크로부터 'contest_id' 열을 만듭니다.
+    """
+    df = df.copy(deep=False)
+    if '링크' in df:
+        df['contest_id'] = [contest_id(link) for link in df['링크']]
+    if '마감일' in df:
+        df['마감일'] = pd.to_datetime(df['마감일'], errors='coerce')
+    if '상금' in df:
+        df['상금_원'] = prize_amounts(df['상금'])
+    for column in CATEGORY_COLUMNS:
+        if column in df:
+            df[column] = df[column].astype('category')
+    return df
+
+def title_collation_key(title) -> str:
+    """제목 정렬 키 (유니코드 정규화 후 대소문자 무시, 한글은 가나다순)"""
+    return unicodedata.normalize('NFKC', str(title)).strip().casefold()
+
+def contest_sort_keys(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """정렬 기준별 int64 키 배열 (마감일은 일 단위 서수, 제목은 정렬 키의 순위, 상금은 원 단위 금액)
+
+    값이 없는 행은 '<키>_missing' 불리언 배열로 표시합니다.
+    """
+    deadlines = pd.to_datetime(df['마감일'], errors='coerce').to_numpy().astype('datetime64[D]')
+    missing = np.isnat(deadlines)
+    days = np.where(missing, 0, deadlines.astype(np.int64))
+    titles = [title_collation_key(title) for title in df['제목'].astype(object).fillna('')]
+    _, title_ranks = np.unique(np.array(titles, dtype=object), return_inverse=True)
+    return {
+        'deadline': days.astype(np.int64),
+        'deadline_missing': missing,
+        'title': title_ranks.astype(np.int64).reshape(-1),
+        'prize': prize_column(df),
+    }
+
+def prize_column(df: pd.DataFrame) -> np.ndarray:
+    """상금_원 열 (없으면 상금 텍스트에서 계산) int64 배열"""
+    if '상금_원' in df:
+        return df['상금_원'].to_numpy(dtype=np.int64)
+    if '상금' in df:
+        return prize_amounts(df['상금']).to_numpy(dtype=np.int64)
+    return np.zeros(len(df), dtype=np.int64)
+
+class SortedContests:
+    """정렬 키를 한 번만 계산하고 정렬 기준별 순서(argsort 결과)를 캐시하는 검색 결과
+
+    페이지 표시는 캐시된 순서의 일부만 잘라 쓰므로 클릭마다 전체를 다시 정렬하지 않습니다.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self._keys = contest_sort_keys(df) if not df.empty else {}
+        self._orders: Dict[str, np.ndarray] = {}
+
+    def __len__(self):
+        return len(self.df)
+
+    def order(self, option: str) -> np.ndarray:
+        """정렬 기준의 행 위치 순서 (같은 값은 원래 순서 유지)"""
+        order = self._orders.get(option)
+        if order is None:
+            if self.df.empty:
+                order = np.arange(0)
+            else:
+                key_name, descending = SORT_OPTIONS[option]
+                keys = self._keys[key_name]
+                missing = self._keys.get(f'{key_name}_missing', np.zeros(len(keys), dtype=bool))
+                # lexsort는 안정 정렬이며 마지막 키가 1순위 (값 없는 행: 오름차순은 마지막, 내림차순은 처음)
+                if descending:
+                    order = np.lexsort((-keys, ~missing))
+                else:
+                    order = np.lexsort((keys, missing))
+            self._orders[option] = order
+        return order
+
+    def subset(self, mask) -> 'SortedContests':
+        """mask에 해당하는 행만 남긴 결과 (정렬 순서는 다시 정렬하지 않고 이 결과의 순서에서 추림)"""
+        mask = np.asarray(mask, dtype=bool)
+        if mask.all():
+            return self
+        subset = SortedContests(self.df.iloc[:0])
+        subset.df = self.df[mask].reset_index(drop=True)
+        subset._keys = {name: keys[mask] for name, keys in self._keys.items()}
+        positions = np.cumsum(mask) - 1  # 원래 행 위치 → 새 행 위치
+        for option in SORT_OPTIONS:
+            order = self.order(option)
+            subset._orders[option] = positions[order[mask[order]]]
+        return subset
+
+    def page(self, option: str, start: int, stop: int) -> pd.DataFrame:
+        """정렬된 결과의 [start, stop) 구간"""
+        return self.df.iloc[self.order(option)[start:stop]]
+
+    def sorted(self, option: str) -> pd.DataFrame:
+        """정렬된 전체 결과"""
+        return self.df.iloc[self.order(option)]
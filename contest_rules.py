@@ -0,0 +1,456 @@
+# contest_rules.py - 마감일/상금 추출 규칙
+#
+# 크롤러의 항목 단위 파싱과 저장된 데이터의 일괄 재계산(normalize_contests)이
+# 같은 규칙 표를 사용하도록 한 곳에 모아 둡니다.
+import re
+import numpy as np
+import pandas as pd
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+from typing import Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from http_cache import normalize_url
+
+# 마감일 추출 규칙 - 목록 순서가 우선순위이며 미리 컴파일해 둠
+# (정규식, 형태, 마감일 그룹 시작 번호)
+#   'date': 날짜 문자열 그룹 하나 (파싱 실패 시 None으로 확정)
+#   'md':   월/일 그룹 (올해 기준, 잘못된 날짜면 다음 규칙으로)
+#   'ymd':  년/월/일 그룹 (잘못된 날짜면 다음 규칙으로)
+CLOSED_DEADLINE_KEYWORDS = ('마감됨', '접수마감', '종료됨', '완료됨')
+CLOSED_DEADLINE = datetime(2020, 1, 1)  # 과거 날짜로 설정하여 필터링되도록
+
+PERIOD_DEADLINE_RULES = [
+    # 2025.01.01 ~ 2025.03.15
+    (re.compile(r'(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})\s*[~\-까지]\s*(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})'), 'date', 2),
+    # 25.01.01 ~ 25.03.15
+    (re.compile(r'(\d{2}[.\-/]\d{1,2}[.\-/]\d{1,2})\s*[~\-까지]\s*(\d{2}[.\-/]\d{1,2}[.\-/]\d{1,2})'), 'date', 2),
+    # 1월 1일 ~ 3월 15일
+    (re.compile(r'(\d{1,2})월\s*(\d{1,2})일\s*[~\-까지]\s*(\d{1,2})월\s*(\d{1,2})일'), 'md', 3),
+    # 2025년 1월 1일 ~ 2025년 3월 15일
+    (re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*[~\-까지]\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일'), 'ymd', 4),
+]
+
+SINGLE_DEADLINE_RULES = [
+    (re.compile(r'마감\s*:?\s*(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})'), 'date', 1),
+    (re.compile(r'까지\s*:?\s*(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})'), 'date', 1),
+    (re.compile(r'(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})\s*마감'), 'date', 1),
+    (re.compile(r'접수마감\s*:?\s*(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})'), 'date', 1),
+    (re.compile(r'(\d{1,2})월\s*(\d{1,2})일\s*마감'), 'md', 1),
+    (re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*마감'), 'ymd', 1),
+    (re.compile(r'마감일\s*:?\s*(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})'), 'date', 1),
+]
+
+D_DAY_PATTERN = re.compile(r'D[－\-](\d+)')
+
+# 단순 날짜 형태 (마지막에 체크, 여러 개면 올해 이후 중 가장 늦은 날짜)
+SIMPLE_DATE_PATTERNS = [
+    re.compile(r'(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})'),
+    re.compile(r'(\d{2}[.\-/]\d{1,2}[.\-/]\d{1,2})'),
+]
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_DATE_SEPARATOR_PATTERN = re.compile(r'[.\-/]')
+_DEADLINE_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=_DEADLINE_CACHE_SIZE)
+def parse_date_string(date_str: str) -> Optional[datetime]:
+    """날짜 문자열을 datetime 객체로 변환"""
+    if not date_str:
+        return None
+    
+    # 구분자 통일
+    date_str = _DATE_SEPARATOR_PATTERN.sub('.', date_str)
+    
+    for fmt in ('%Y.%m.%d', '%y.%m.%d'):
+        try:
+            parsed_date = datetime.strptime(date_str, fmt)
+            # 2자리 연도를 4자리로 변환
+            if parsed_date.year < 2000:
+                parsed_date = parsed_date.replace(year=parsed_date.year + 2000)
+            return parsed_date
+        except ValueError:
+            continue
+    
+    return None
+
+def _deadline_from_rule(match, kind, start, today: date) -> Optional[datetime]:
+    """규칙 형태에 맞게 매치 결과를 날짜로 변환 (잘못된 년/월/일이면 ValueError)"""
+    if kind == 'ymd':
+        return datetime(int(match.group(start)), int(match.group(start + 1)), int(match.group(start + 2)))
+    if kind == 'md':
+        return datetime(today.year, int(match.group(start)), int(match.group(start + 1)))
+    return parse_date_string(match.group(start))
+
+@lru_cache(maxsize=_DEADLINE_CACHE_SIZE)
+def _parse_normalized_deadline(text: str, today: date) -> Optional[datetime]:
+    # 마감된 공모전 키워드 체크 (먼저 체크해서 빠르게 제외)
+    lowered = text.lower()
+    if any(keyword in lowered for keyword in CLOSED_DEADLINE_KEYWORDS):
+        return CLOSED_DEADLINE
+    
+    # 1. 접수기간 형태, 2. 단일 마감일 형태
+    for rules in (PERIOD_DEADLINE_RULES, SINGLE_DEADLINE_RULES):
+        for pattern, kind, start in rules:
+            match = pattern.search(text)
+            if match:
+                try:
+                    return _deadline_from_rule(match, kind, start, today)
+                except (ValueError, IndexError):
+                    continue
+    
+    # 3. D-day 형태
+    d_match = D_DAY_PATTERN.search(text)
+    if d_match:
+        return datetime(today.year, today.month, today.day) + timedelta(days=int(d_match.group(1)))
+    
+    # 4. 단순 날짜 형태
+    for pattern in SIMPLE_DATE_PATTERNS:
+        dates = [
+            parsed for parsed in map(parse_date_string, pattern.findall(text))
+            if parsed and parsed.year >= today.year
+        ]
+        if dates:
+            return max(dates)
+    
+    return None
+
+def parse_deadline(text: str, today: Optional[date] = None) -> Optional[datetime]:
+    """텍스트에서 마감일 추출
+    
+    공백을 정리한 텍스트와 기준 날짜별로 결과를 기억하므로, 페이지와 키워드마다
+    반복되는 기간 문자열은 한 번만 파싱합니다.
+    """
+    if not text:
+        return None
+    
+    text = _WHITESPACE_PATTERN.sub(' ', text.strip())
+    return _parse_normalized_deadline(text, today or datetime.now().date())
+
+# 상금 규칙 - 표시 문자열과 금액(원)을 같은 규칙 표에서 얻음
+# 금액 표기: 숫자 + 단위(억/만/원, '억원'/'만원'), 단위가 없으면 원으로 보되 숫자 뒤에 다른 글자가 붙으면
+# ('5명', '3팀') 금액이 아님. '300 (만원)'처럼 괄호 안의 단위는 먼저 풀어 둠
+_PRIZE_AMOUNT = r'(?P<number>\d+(?:,\d+)*(?:\.\d+)?)(?:\s*(?P<unit>억\s*원?|만\s*원?|원)|(?!\w|[.,]\d))'
+_PRIZE_UNIT_AMOUNT = r'(?P<number>\d+(?:,\d+)*(?:\.\d+)?)\s*(?P<unit>억\s*원?|만\s*원?|원)'
+PRIZE_UNIT_PATTERN = re.compile(r'\(\s*((?:억|만)?\s*원)\s*\)')
+PRIZE_UNIT_VALUES = {'억': 100_000_000, '만': 10_000, '원': 1}
+MIN_WON_PRIZE = 100_000  # 항목명 없이 원 단위로만 적힌 금액은 10만원 이상만 상금으로 봄
+MAX_PRIZE_AMOUNT = 10 ** 15  # 금액 상한 (숫자가 잘못 이어 붙은 텍스트가 int64와 float 정밀도를 넘지 않도록)
+
+# (정규식, 형태) - 목록 순서가 우선순위
+#   'first':   1등 상금 ('1등: 500만원', '대상 1,000만원', '1등 상금 500만원') → '1등: 금액'
+#              단위(원/만원/억)가 붙은 금액만 인정, '응모대상'·'참가대상'처럼 다른 낱말에 붙은 '대상'은 제외
+#   'labeled': 상금/총상금 ('상금: 500,000', '총 상금 1억원') → '총상금: 금액'
+#   'largest': 항목명 없는 금액 중 가장 큰 금액 → '금액'
+PRIZE_RULES = [
+    (re.compile(r'(?:1등|(?<![가-힣])대상|최우수상|금상|우승)[^\d\n]{0,20}?' + _PRIZE_UNIT_AMOUNT), 'first'),
+    (re.compile(r'(?P<label>총\s*상금|상금)[^\d\n]{0,10}?' + _PRIZE_AMOUNT), 'labeled'),
+    (re.compile(_PRIZE_UNIT_AMOUNT), 'largest'),
+]
+
+# 정보가 없을 때 사용하는 자리표시 문자열
+NO_HOST_TEXT = "주최자 정보 없음"
+NO_PERIOD_TEXT = "기간 정보 없음"
+NO_PRIZE_TEXT = "상금 정보 없음"
+
+# 같은 공모전이라도 검색 위치에 따라 달라지는 링크 파라미터 (페이지 번호, 검색어 등)
+VOLATILE_LINK_PARAMS = ('gp', 'sw', 'sp')
+
+def normalize_contest_link(link: str) -> str:
+    """공모전 식별용 링크 정규화 (검색 위치에 따라 바뀌는 파라미터 제거)"""
+    parts = urlsplit(normalize_url(link))
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if k not in VOLATILE_LINK_PARAMS])
+    return urlunsplit(parts._replace(query=query))
+
+def _prize_unit_value(unit) -> int:
+    return PRIZE_UNIT_VALUES[unit[0]] if unit else 1
+
+def _prize_amount_text(match) -> str:
+    """매치의 금액 표시 ('500만원', '1억원', '500,000원')"""
+    unit = (match.group('unit') or '').replace(' ', '')
+    return match.group('number') + (unit if unit.endswith('원') else unit + '원')
+
+def _prize_match_value(match) -> float:
+    return float(match.group('number').replace(',', '')) * _prize_unit_value(match.group('unit'))
+
+def _prize_won(value: float) -> int:
+    return int(round(min(value, MAX_PRIZE_AMOUNT)))
+
+def normalize_prize(text) -> Optional[Tuple[str, int]]:
+    """상금 텍스트를 (표시 문자열, 1등 상금액(원))으로 정규화 (상금을 찾지 못하면 None)
+
+    PRIZE_RULES를 순서대로 적용하며, 표시 문자열을 다시 정규화해도 같은 결과가 나옵니다.
+    """
+    if not text or text == NO_PRIZE_TEXT:
+        return None
+    text = PRIZE_UNIT_PATTERN.sub(r'\1', str(text))
+
+    for pattern, kind in PRIZE_RULES:
+        if kind == 'largest':
+            matches = [
+                (value, match) for match in pattern.finditer(text)
+                for value in [_prize_match_value(match)]
+                if value >= MIN_WON_PRIZE or _prize_unit_value(match.group('unit')) > 1
+            ]
+            if not matches:
+                continue
+            value, match = max(matches, key=lambda item: item[0])
+            return _prize_amount_text(match), _prize_won(value)
+
+        match = pattern.search(text)
+        if match:
+            if kind == 'first':
+                label = '1등'
+            else:
+                label = _WHITESPACE_PATTERN.sub('', match.group('label'))
+            return f"{label}: {_prize_amount_text(match)}", _prize_won(_prize_match_value(match))
+    return None
+
+def find_prize_text(text: str) -> Optional[str]:
+    """목록 항목 본문에서 상금 표시 문자열 찾기 (1등 상금 우선, 없으면 None)"""
+    prize = normalize_prize(text)
+    return prize[0] if prize else None
+
+def parse_prize_amount(prize_text) -> int:
+    """상금 텍스트에서 1등 상금액(원) 추출 (없으면 0)"""
+    prize = normalize_prize(prize_text)
+    return prize[1] if prize else 0
+
+# ---- 벡터화 버전 (DataFrame 일괄 재계산용) ----
+
+_NAT = np.datetime64('NaT', 'D')
+
+def _dates_from_parts(year, month, day) -> np.ndarray:
+    """년/월/일 배열로 datetime64[D] 배열 생성 (잘못된 날짜는 NaT)"""
+    year = np.asarray(year, dtype=float)
+    month = np.asarray(month, dtype=float)
+    day = np.asarray(day, dtype=float)
+    
+    result = np.full(len(year), _NAT)
+    valid = ~(np.isnan(year) | np.isnan(month) | np.isnan(day))
+    valid[valid] = (
+        (year[valid] >= 1) & (year[valid] <= 9999)
+        & (month[valid] >= 1) & (month[valid] <= 12) & (day[valid] >= 1) & (day[valid] <= 31)
+    )
+    if not valid.any():
+        return result
+    
+    month_start = ((year[valid].astype(np.int64) - 1970) * 12 + month[valid].astype(np.int64) - 1).astype('datetime64[M]')
+    first_day = month_start.astype('datetime64[D]')
+    days_in_month = ((month_start + 1).astype('datetime64[D]') - first_day).astype(np.int64)
+    day = day[valid].astype(np.int64)
+    
+    dates = first_day + (day - 1).astype('timedelta64[D]')
+    dates[day > days_in_month] = _NAT
+    result[valid] = dates
+    return result
+
+def _parse_date_strings(date_strings: pd.Series) -> np.ndarray:
+    """parse_date_string의 벡터화 버전"""
+    parts = date_strings.str.split(_DATE_SEPARATOR_PATTERN.pattern, n=2, expand=True, regex=True)
+    if parts.shape[1] < 3:
+        return np.full(len(date_strings), _NAT)
+    
+    year_text = parts[0]
+    year = pd.to_numeric(year_text, errors='coerce').to_numpy(dtype=float, copy=True)
+    two_digit = (year_text.str.len() == 2).to_numpy()
+    # '%Y'는 0년을 허용하지 않고, '%y'는 두 자리 연도만 받음
+    year[(year == 0) & ~two_digit] = np.nan
+    # '%y'는 69~99를 1969~1999로 읽으므로 parse_date_string처럼 그 뒤에 2000을 더함 (99 → 3999)
+    year = np.where(two_digit & (year >= 69), year + 1900, year)
+    year = np.where(year < 2000, year + 2000, year)
+    
+    month = pd.to_numeric(parts[1], errors='coerce').to_numpy(dtype=float)
+    day = pd.to_numeric(parts[2], errors='coerce').to_numpy(dtype=float)
+    return _dates_from_parts(year, month, day)
+
+def _dates_from_rule(groups: pd.DataFrame, kind, start, today: date) -> np.ndarray:
+    """str.extract 결과를 규칙 형태에 맞게 날짜로 변환"""
+    column = start - 1
+    if kind == 'date':
+        return _parse_date_strings(groups[column])
+    
+    numbers = groups.apply(pd.to_numeric, errors='coerce')
+    if kind == 'md':
+        return _dates_from_parts(np.full(len(groups), today.year), numbers[column], numbers[column + 1])
+    return _dates_from_parts(numbers[column], numbers[column + 1], numbers[column + 2])
+
+def deadlines_from_text(texts, today: Optional[date] = None) -> pd.Series:
+    """parse_deadline의 벡터화 버전
+    
+    같은 규칙 표를 우선순위 순서대로 아직 결정되지 않은 행 전체에 적용합니다.
+    결과는 date 객체 (없으면 None)로 이루어진 Series입니다.
+    """
+    today = today or datetime.now().date()
+    original = pd.Series(texts)
+    texts = original.reset_index(drop=True).astype(object).fillna('').astype(str)
+    texts = texts.str.strip().str.replace(_WHITESPACE_PATTERN.pattern, ' ', regex=True)
+    
+    result = np.full(len(texts), _NAT)
+    resolved = (texts == '').to_numpy(copy=True)
+    
+    # 마감된 공모전 키워드
+    closed_pattern = '|'.join(map(re.escape, CLOSED_DEADLINE_KEYWORDS))
+    closed = texts.str.lower().str.contains(closed_pattern, regex=True).to_numpy() & ~resolved
+    result[closed] = np.datetime64(CLOSED_DEADLINE.date(), 'D')
+    resolved |= closed
+    
+    # 1. 접수기간 형태, 2. 단일 마감일 형태
+    for rules in (PERIOD_DEADLINE_RULES, SINGLE_DEADLINE_RULES):
+        for pattern, kind, start in rules:
+            todo = np.flatnonzero(~resolved)
+            if not len(todo):
+                break
+            
+            groups = texts.iloc[todo].str.extract(pattern)
+            matched = groups[start - 1].notna().to_numpy()
+            dates = _dates_from_rule(groups, kind, start, today)
+            
+            # 'date' 형태는 날짜가 잘못되어도 그 결과(None)로 확정
+            done = matched if kind == 'date' else matched & ~np.isnat(dates)
+            result[todo[done]] = dates[done]
+            resolved[todo[done]] = True
+    
+    # 3. D-day 형태
+    todo = np.flatnonzero(~resolved)
+    if len(todo):
+        days = pd.to_numeric(texts.iloc[todo].str.extract(D_DAY_PATTERN)[0], errors='coerce').to_numpy()
+        matched = ~np.isnan(days)
+        in_range = matched & (days <= (date.max - today).days)  # 날짜 범위를 벗어나는 D-day 제외
+        dates = np.full(len(todo), _NAT)
+        dates[in_range] = np.datetime64(today, 'D') + days[in_range].astype(np.int64).astype('timedelta64[D]')
+        result[todo[matched]] = dates[matched]
+        resolved[todo[matched]] = True
+    
+    # 4. 단순 날짜 형태 (올해 이후 날짜 중 가장 늦은 날짜)
+    for pattern in SIMPLE_DATE_PATTERNS:
+        todo = np.flatnonzero(~resolved)
+        if not len(todo):
+            break
+        
+        found = texts.iloc[todo].str.extractall(pattern)[0]
+        if found.empty:
+            continue
+        
+        dates = _parse_date_strings(found)
+        keep = ~np.isnat(dates)
+        keep[keep] = dates[keep].astype('datetime64[Y]').astype(np.int64) + 1970 >= today.year
+        if not keep.any():
+            continue
+        
+        rows = found.index.get_level_values(0).to_numpy()[keep]
+        latest = pd.Series(dates[keep].astype(np.int64), index=rows).groupby(level=0).max()
+        result[latest.index.to_numpy()] = latest.to_numpy().astype('datetime64[D]')
+        resolved[latest.index.to_numpy()] = True
+    
+    return pd.Series(result.astype(object), index=original.index, dtype=object)
+
+def _prize_values(groups: pd.DataFrame) -> pd.Series:
+    """str.extract/extractall 결과의 number/unit 열로 금액(원) 계산"""
+    numbers = pd.to_numeric(groups['number'].str.replace(',', '', regex=False), errors='coerce')
+    units = groups['unit'].str[0].map(PRIZE_UNIT_VALUES).fillna(1)
+    return numbers * units
+
+def prize_amounts(texts) -> pd.Series:
+    """parse_prize_amount의 벡터화 버전 (int64, 없으면 0)"""
+    original = pd.Series(texts)
+    texts = original.reset_index(drop=True).astype(object).fillna('').astype(str)
+    
+    amounts = np.zeros(len(texts))
+    resolved = ((texts == '') | (texts == NO_PRIZE_TEXT)).to_numpy(copy=True)
+    texts = texts.str.replace(PRIZE_UNIT_PATTERN.pattern, r'\1', regex=True)
+    
+    for pattern, kind in PRIZE_RULES:
+        todo = np.flatnonzero(~resolved)
+        if not len(todo):
+            break
+        
+        if kind == 'largest':
+            found = texts.iloc[todo].str.extractall(pattern)
+            if found.empty:
+                continue
+            values = _prize_values(found)
+            values = values[(values >= MIN_WON_PRIZE) | (found['unit'].str[0] != '원')]
+            if values.empty:
+                continue
+            largest = values.groupby(level=0).max()
+            rows = largest.index.to_numpy()
+            amounts[rows] = largest.to_numpy()
+            resolved[rows] = True
+            continue
+        
+        groups = texts.iloc[todo].str.extract(pattern)
+        values = _prize_values(groups).to_numpy()
+        matched = groups['number'].notna().to_numpy()
+        amounts[todo[matched]] = values[matched]
+        resolved[todo[matched]] = True
+    
+    return pd.Series(np.round(np.minimum(amounts, MAX_PRIZE_AMOUNT)).astype(np.int64), index=original.index)
+
+def normalize_contests(df: pd.DataFrame, today: Optional[date] = None) -> pd.DataFrame:
+    """저장된 공모전의 마감일과 상금액을 현재 규칙으로 일괄 재계산
+    
+    마감일은 '기간', 없으면 '제목'에서 다시 추출하고, 둘 다 실패하면 기존 값을 유지합니다.
+    '상금' 텍스트로부터 숫자 상금액 열 '상금_원'을 만듭니다.
+    """
+    df = df.copy()
+    if df.empty:
+        return df
+    
+    deadlines = pd.Series(None, index=df.index, dtype=object)
+    for column in ('기간', '제목'):
+        if column in df:
+            missing = deadlines.isna()
+            if missing.any():
+                deadlines[missing] = deadlines_from_text(df.loc[missing, column], today)
+    
+    if '마감일' in df:
+        deadlines = deadlines.where(deadlines.notna(), df['마감일'])
+    df['마감일'] = pd.to_datetime(deadlines, errors='coerce')
+    
+    if '상금' in df:
+        df['상금_원'] = prize_amounts(df['상금'])
+    return df
+
+# 공모전이 아닌 항목(모집/교육/행사 등)을 거르는 제목 키워드
+EXCLUDE_TITLE_KEYWORDS = (
+    '모집', '채용', '무료', '멘토링', 'special', '스페셜',
+    '교육', '강의', '세미나', '워크샵', '설명회', '상담',
+    '지원자', '참가자', '수강생', '인턴', '아르바이트',
+    '봉사', '자원봉사', '기부', '후원', '협찬'
+)
+# 마감일이 없을 때 기간 텍스트로 마감 여부 판단
+CLOSED_PERIOD_KEYWORDS = ('마감', '종료', '완료')
+
+_EXCLUDE_TITLE_PATTERN = '|'.join(re.escape(keyword) for keyword in EXCLUDE_TITLE_KEYWORDS)
+_CLOSED_PERIOD_PATTERN = '|'.join(re.escape(keyword) for keyword in CLOSED_PERIOD_KEYWORDS)
+
+def filter_contests(df: pd.DataFrame, from_date=None, to_date=None, today: Optional[date] = None) -> pd.DataFrame:
+    """날짜 범위와 제외 키워드로 공모전 일괄 필터링
+    
+    WevityCrawler._filter_by_date와 같은 규칙입니다. 마감일이 지났거나 범위를 벗어난 공모전,
+    제외 키워드가 제목에 있는 공모전, 마감일 없이 기간에 마감 표시가 있는 공모전을 제외합니다.
+    """
+    if df.empty:
+        return df
+    
+    today = np.datetime64(today or datetime.now().date(), 'D')
+    titles = df['제목'].astype(object).fillna('').astype(str).str.lower()
+    keep = ~titles.str.contains(_EXCLUDE_TITLE_PATTERN, regex=True).to_numpy()
+    
+    deadlines = pd.to_datetime(df['마감일'], errors='coerce').to_numpy().astype('datetime64[D]')
+    has_deadline = ~np.isnat(deadlines)
+    in_range = deadlines >= today
+    if from_date:
+        in_range &= deadlines >= np.datetime64(from_date, 'D')
+    if to_date:
+        in_range &= deadlines <= np.datetime64(to_date, 'D')
+    
+    if '기간' in df:
+        periods = df['기간'].astype(object).fillna('').astype(str).str.lower()
+        closed = periods.str.contains(_CLOSED_PERIOD_PATTERN, regex=True).to_numpy()
+    else:
+        closed = np.zeros(len(df), dtype=bool)
+    
+    keep &= np.where(has_deadline, in_range, ~closed)
+    return df[keep].reset_index(drop=True)
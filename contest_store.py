@@ -0,0 +1,329 @@
+# contest_store.py - 로컬 SQLite 공모전 저장소
+import os
+import re
+import time
+import sqlite3
+import logging
+from contextlib import closing, contextmanager
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Iterator
+import pandas as pd
+from http_cache import DEFAULT_CACHE_DIR
+from contest_rules import normalize_contest_link, NO_HOST_TEXT, NO_PERIOD_TEXT, NO_PRIZE_TEXT
+from contest_model import Contest, as_contest_frame
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.getenv('WEVITY_DB_PATH', os.path.join(DEFAULT_CACHE_DIR, 'contests.db'))
+DEFAULT_MAX_AGE = int(os.getenv('WEVITY_STORE_MAX_AGE', '21600'))  # 초 단위, 이보다 오래된 키워드는 다시 크롤링
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contests (
+    link_key   TEXT PRIMARY KEY,
+    link       TEXT NOT NULL,
+    title      TEXT NOT NULL,
+    host       TEXT,
+    period     TEXT,
+    deadline   TEXT,
+    prize      TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_contests_deadline ON contests(deadline);
+
+CREATE TABLE IF NOT EXISTS contest_keywords (
+    keyword   TEXT NOT NULL,
+    link_key  TEXT NOT NULL REFERENCES contests(link_key) ON DELETE CASCADE,
+    last_seen TEXT NOT NULL,
+    PRIMARY KEY (keyword, link_key)
+);
+CREATE INDEX IF NOT EXISTS idx_contest_keywords_link ON contest_keywords(link_key);
+
+CREATE TABLE IF NOT EXISTS crawl_log (
+    keyword      TEXT PRIMARY KEY,
+    max_pages    INTEGER NOT NULL,
+    result_count INTEGER NOT NULL,
+    crawled_at   TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS locks (
+    name       TEXT PRIMARY KEY,
+    owner      TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+# 제목/주최/기간 전문 검색 색인 - trigram 토크나이저는 띄어쓰기와 무관하게
+# 3글자 이상의 부분 문자열을 찾으므로 한국어 검색에 적합합니다.
+# contests 테이블의 rowid를 참조하므로 VACUUM 후에는 rebuild_index()가 필요합니다.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE contests_fts USING fts5(
+    title, host, period,
+    content='contests', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS contests_fts_insert AFTER INSERT ON contests BEGIN
+    INSERT INTO contests_fts (rowid, title, host, period) VALUES (new.rowid, new.title, new.host, new.period);
+END;
+CREATE TRIGGER IF NOT EXISTS contests_fts_delete AFTER DELETE ON contests BEGIN
+    INSERT INTO contests_fts (contests_fts, rowid, title, host, period)
+    VALUES ('delete', old.rowid, old.title, old.host, old.period);
+END;
+CREATE TRIGGER IF NOT EXISTS contests_fts_update AFTER UPDATE OF title, host, period ON contests BEGIN
+    INSERT INTO contests_fts (contests_fts, rowid, title, host, period)
+    VALUES ('delete', old.rowid, old.title, old.host, old.period);
+    INSERT INTO contests_fts (rowid, title, host, period) VALUES (new.rowid, new.title, new.host, new.period);
+END;
+"""
+
+FTS_MIN_TERM_LENGTH = 3  # trigram 토크나이저가 찾을 수 있는 최소 길이
+FTS_COLUMN_WEIGHTS = (10.0, 2.0, 1.0)  # bm25 가중치 (제목, 주최, 기간)
+
+# 새로 수집한 값이 자리표시 문자열이면 기존 값을 유지
+UPSERT_CONTEST = f"""
+INSERT INTO contests (link_key, link, title, host, period, deadline, prize, first_seen, last_seen)
+VALUES (:link_key, :link, :title, :host, :period, :deadline, :prize, :seen, :seen)
+ON CONFLICT(link_key) DO UPDATE SET
+    link      = excluded.link,
+    title     = excluded.title,
+    host      = CASE WHEN excluded.host = '{NO_HOST_TEXT}' THEN contests.host ELSE excluded.host END,
+    period    = CASE WHEN excluded.period = '{NO_PERIOD_TEXT}' THEN contests.period ELSE excluded.period END,
+    deadline  = COALESCE(excluded.deadline, contests.deadline),
+    prize     = CASE WHEN excluded.prize = '{NO_PRIZE_TEXT}' THEN contests.prize ELSE excluded.prize END,
+    last_seen = excluded.last_seen
+"""
+
+UPSERT_KEYWORD = """
+INSERT INTO contest_keywords (keyword, link_key, last_seen)
+VALUES (?, ?, ?)
+ON CONFLICT(keyword, link_key) DO UPDATE SET last_seen = excluded.last_seen
+"""
+
+CONTEST_COLUMNS = """
+    c.title AS 제목, c.host AS 주최, c.period AS 기간, c.deadline AS 마감일, c.prize AS 상금, c.link AS 링크
+"""
+
+class ContestStore:
+    """링크 기준으로 공모전을 저장하고 키워드/마감일로 조회하는 저장소
+
+    연결은 호출마다 새로 열기 때문에 여러 스레드(Streamlit 세션 등)에서 함께 사용할 수 있습니다.
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        self.fts_enabled = self._init_fts()
+
+    def _init_fts(self) -> bool:
+        """전문 검색 색인 생성 (FTS5/trigram을 지원하지 않는 SQLite면 LIKE 검색으로 대체)"""
+        try:
+            with self._connect() as conn:
+                exists = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'contests_fts'"
+                ).fetchone()
+                if not exists:
+                    conn.executescript(FTS_SCHEMA)
+                    # 색인 이전에 저장된 공모전 반영
+                    conn.execute("INSERT INTO contests_fts (contests_fts) VALUES ('rebuild')")
+            return True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"전문 검색 색인을 사용할 수 없어 LIKE 검색을 사용합니다: {e}")
+            return False
+
+    def rebuild_index(self):
+        """전문 검색 색인 재구성"""
+        if self.fts_enabled:
+            with self._connect() as conn:
+                conn.execute("INSERT INTO contests_fts (contests_fts) VALUES ('rebuild')")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션 연결 (정상 종료 시 커밋, 예외 시 롤백하고 항상 연결을 닫음)"""
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            conn.execute("PRAGMA foreign_keys=ON")
+            with conn:
+                yield conn
+
+    def upsert(self, contests, keyword=None) -> int:
+        """공모전 저장 (이미 있으면 갱신), 저장한 개수 반환
+
+        contests는 DataFrame, Contest 또는 dict 목록입니다. keyword가 없으면
+        crawl_many 결과의 matched_keywords 열을 키워드로 사용합니다.
+        """
+        if isinstance(contests, pd.DataFrame):
+            records = contests.to_dict('records')
+        else:
+            records = [record.to_dict() if isinstance(record, Contest) else record for record in contests]
+        if not records:
+            return 0
+
+        now = datetime.now().isoformat(timespec='seconds')
+        rows = []
+        keyword_rows = []
+        for record in records:
+            link_key = normalize_contest_link(record['링크'])
+            deadline = record.get('마감일')
+            rows.append({
+                'link_key': link_key,
+                'link': record['링크'],
+                'title': record.get('제목', ''),
+                'host': record.get('주최', NO_HOST_TEXT),
+                'period': record.get('기간', NO_PERIOD_TEXT),
+                'deadline': _to_iso_date(deadline),
+                'prize': record.get('상금', NO_PRIZE_TEXT),
+                'seen': now,
+            })
+
+            keywords = [keyword] if keyword else str(record.get('matched_keywords') or '').split(', ')
+            for kw in keywords:
+                if kw and kw.strip():
+                    keyword_rows.append((kw.strip(), link_key, now))
+
+        with self._connect() as conn:
+            conn.executemany(UPSERT_CONTEST, rows)
+            conn.executemany(UPSERT_KEYWORD, keyword_rows)
+
+        logger.info(f"저장소에 {len(rows)}개 공모전 저장")
+        return len(rows)
+
+    def record_crawl(self, keyword, max_pages, result_count):
+        """키워드 크롤링 시각 기록"""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO crawl_log (keyword, max_pages, result_count, crawled_at) VALUES (?, ?, ?, ?)",
+                (keyword.strip(), max_pages, result_count, datetime.now().isoformat(timespec='seconds'))
+            )
+
+    def last_crawl(self, keyword) -> Optional[Dict]:
+        """키워드의 마지막 크롤링 기록 (없으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT max_pages, result_count, crawled_at FROM crawl_log WHERE keyword = ?",
+                (keyword.strip(),)
+            ).fetchone()
+        if not row:
+            return None
+        return {'max_pages': row[0], 'result_count': row[1], 'crawled_at': datetime.fromisoformat(row[2])}
+
+    def acquire_lock(self, name, owner, ttl) -> bool:
+        """프로세스 간 임대 잠금 획득/연장 (ttl초 동안 유효, 만료된 잠금은 다른 소유자가 가져감)"""
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO locks (name, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+                WHERE locks.owner = excluded.owner OR locks.expires_at < ?
+                """,
+                (name, owner, now + ttl, now)
+            )
+            return cursor.rowcount == 1
+
+    def release_lock(self, name, owner):
+        """보유한 잠금 해제"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM locks WHERE name = ? AND owner = ?", (name, owner))
+
+    def query(self, keyword=None, from_date=None, to_date=None, include_undated=True) -> pd.DataFrame:
+        """키워드와 마감일 범위로 공모전 조회 (마감일 순)"""
+        conditions = []
+        params: List = []
+
+        if keyword:
+            conditions.append("c.link_key IN (SELECT link_key FROM contest_keywords WHERE keyword = ?)")
+            params.append(keyword.strip())
+
+        _add_date_conditions(conditions, params, from_date, to_date, include_undated)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = f"SELECT {CONTEST_COLUMNS} FROM contests c {where} ORDER BY c.deadline IS NULL, c.deadline, c.title"
+        return self._read_frame(sql, params)
+
+    def search(self, text, from_date=None, to_date=None, include_undated=True, limit=200) -> pd.DataFrame:
+        """제목/주최/기간 전문 검색 (관련도 순)
+
+        공백으로 나눈 검색어를 모두 포함하는 공모전을 찾습니다. 3글자 이상의 검색어는
+        FTS5 색인으로 찾아 bm25 점수로 정렬하고, 그보다 짧은 검색어는 LIKE로 거릅니다.
+        """
+        terms = [term for term in text.split() if term]
+        if not terms:
+            return self._read_frame(f"SELECT {CONTEST_COLUMNS} FROM contests c WHERE 0", [])
+
+        if self.fts_enabled:
+            fts_terms = [term for term in terms if len(term) >= FTS_MIN_TERM_LENGTH]
+            like_terms = [term for term in terms if len(term) < FTS_MIN_TERM_LENGTH]
+        else:
+            fts_terms, like_terms = [], terms
+
+        conditions = []
+        params: List = []
+        if fts_terms:
+            conditions.append("contests_fts MATCH ?")
+            params.append(' AND '.join('"{}"'.format(term.replace('"', '""')) for term in fts_terms))
+        for term in like_terms:
+            pattern = f"%{_escape_like(term)}%"
+            conditions.append(
+                "(c.title LIKE ? ESCAPE '\\' OR c.host LIKE ? ESCAPE '\\' OR c.period LIKE ? ESCAPE '\\')"
+            )
+            params.extend([pattern, pattern, pattern])
+
+        _add_date_conditions(conditions, params, from_date, to_date, include_undated)
+        where = ' AND '.join(conditions)
+
+        if fts_terms:
+            weights = ', '.join(str(w) for w in FTS_COLUMN_WEIGHTS)
+            sql = (f"SELECT {CONTEST_COLUMNS} FROM contests_fts JOIN contests c ON c.rowid = contests_fts.rowid "
+                   f"WHERE {where} ORDER BY bm25(contests_fts, {weights}) LIMIT ?")
+        else:
+            sql = (f"SELECT {CONTEST_COLUMNS} FROM contests c "
+                   f"WHERE {where} ORDER BY c.deadline IS NULL, c.deadline, c.title LIMIT ?")
+        params.append(limit)
+        return self._read_frame(sql, params)
+
+    def is_stale(self, keyword, max_age=DEFAULT_MAX_AGE) -> bool:
+        """키워드를 max_age초 안에 크롤링한 기록이 없으면 True"""
+        last = self.last_crawl(keyword)
+        return last is None or datetime.now() - last['crawled_at'] > timedelta(seconds=max_age)
+
+    def _read_frame(self, sql, params) -> pd.DataFrame:
+        with self._connect() as conn:
+            df = pd.read_sql_query(sql, conn, params=params)
+
+        return as_contest_frame(df)
+
+    def count(self) -> int:
+        """저장된 공모전 수"""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM contests").fetchone()[0]
+
+def _add_date_conditions(conditions, params, from_date, to_date, include_undated):
+    """마감일 범위 조건 추가 (include_undated면 마감일 없는 공모전도 포함)"""
+    date_conditions = []
+    if from_date:
+        date_conditions.append("c.deadline >= ?")
+        params.append(_to_iso_date(from_date))
+    if to_date:
+        date_conditions.append("c.deadline <= ?")
+        params.append(_to_iso_date(to_date))
+    if date_conditions:
+        date_clause = " AND ".join(date_conditions)
+        if include_undated:
+            date_clause = f"(c.deadline IS NULL OR ({date_clause}))"
+        conditions.append(date_clause)
+
+_LIKE_SPECIAL_PATTERN = re.compile(r'([%_\\])')
+
+def _escape_like(term: str) -> str:
+    return _LIKE_SPECIAL_PATTERN.sub(r'\\\1', term)
+
+def _to_iso_date(value) -> Optional[str]:
+    """date/datetime/Timestamp를 'YYYY-MM-DD' 문자열로 변환"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, str):
+        return value[:10]
+    if isinstance(value, datetime):
+        value = value.date()
+    return value.isoformat()
@@ -0,0 +1,266 @@
+# driver_pool.py - 재사용 가능한 Chrome 드라이버 풀
+import os
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Tuple
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException
+from webdriver_manager.chrome import ChromeDriverManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = int(os.getenv('WEVITY_DRIVER_POOL_SIZE', '2'))
+DEFAULT_MAX_PAGES_PER_DRIVER = int(os.getenv('WEVITY_DRIVER_MAX_PAGES', '50'))
+BLOCK_RESOURCES = os.getenv('WEVITY_BLOCK_RESOURCES', '1') == '1'
+
+# 목록 파싱에 필요 없는 리소스 - CDP Network.setBlockedURLs 와일드카드 패턴
+BLOCKED_EXTENSIONS = (
+    'png', 'jpg', 'jpeg', 'gif', 'webp', 'svg', 'ico', 'bmp',  # 이미지
+    'woff', 'woff2', 'ttf', 'otf', 'eot',  # 폰트
+    'mp4', 'webm', 'mp3', 'ogg', 'avi', 'mov',  # 미디어
+)
+BLOCKED_THIRD_PARTY_HOSTS = (
+    'googletagmanager.com', 'google-analytics.com', 'googlesyndication.com', 'doubleclick.net',
+    'googleadservices.com', 'adservice.google.com', 'facebook.net', 'connect.facebook.com',
+    'wcs.naver.net', 'analytics.kakao.com', 't1.daumcdn.net/kas', 'criteo.com', 'criteo.net',
+)
+
+def blocked_url_patterns():
+    """차단할 URL 패턴 (WEVITY_BLOCKED_URL_PATTERNS에 쉼표로 추가 가능)"""
+    patterns = []
+    for ext in BLOCKED_EXTENSIONS:
+        patterns += [f'*.{ext}', f'*.{ext}?*']
+    patterns += [f'*://*{host}*' for host in BLOCKED_THIRD_PARTY_HOSTS]
+    extra = os.getenv('WEVITY_BLOCKED_URL_PATTERNS', '')
+    patterns += [pattern.strip() for pattern in extra.split(',') if pattern.strip()]
+    return patterns
+
+def block_resources(driver) -> bool:
+    """CDP로 이미지/폰트/미디어/외부 추적 스크립트 요청 차단 (Chrome 전용)"""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_url_patterns()})
+        return True
+    except Exception as e:
+        logger.debug(f"리소스 차단 설정 실패: {e}")
+        return False
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+def resolve_driver_path() -> str:
+    """ChromeDriver 경로 확인 (프로세스당 한 번만 설치/조회)"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+def build_chrome_options(headless=True, user_agent=None) -> Options:
+    """Chrome 옵션 설정"""
+    options = Options()
+
+    # 기본 옵션
+    if headless:
+        options.add_argument('--headless=new')  # 새로운 headless 모드
+
+    # 안정성 개선 옵션들
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--disable-plugins')
+    options.add_argument('--window-size=1920,1080')
+
+    # User-Agent 설정
+    if user_agent:
+        options.add_argument(f'--user-agent={user_agent}')
+
+    # 자동화 감지 방지
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    
+    # 이미지 로딩 비활성화 (네트워크 요청 자체는 block_resources에서 차단)
+    options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+
+    # 페이지 로딩 전략
+    options.page_load_strategy = 'eager'  # DOM이 준비되면 바로 진행
+    return options
+
+class PooledDriver:
+    """풀에서 빌려준 드라이버와 사용 기록"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages_served = 0
+        self.broken = False
+
+    def get(self, url):
+        """페이지 이동 (재활용 기준이 되는 페이지 수 집계)"""
+        self.pages_served += 1
+        self.driver.get(url)
+
+class ChromeDriverPool:
+    """스레드 안전한 headless Chrome 드라이버 풀
+
+    드라이버를 미리 띄워 두고 재사용합니다. 빌려줄 때 상태를 확인하고,
+    max_pages_per_driver 페이지를 처리했거나 오류가 난 드라이버는 종료 후 새로 만듭니다.
+    """
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, headless=True, timeout=30,
+                 max_pages_per_driver=DEFAULT_MAX_PAGES_PER_DRIVER, user_agent=None):
+        self.size = max(1, size)
+        self.headless = headless
+        self.timeout = timeout
+        self.max_pages_per_driver = max_pages_per_driver
+        self.user_agent = user_agent
+        self._idle = []
+        self._total = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    def _create_driver(self) -> PooledDriver:
+        """새 Chrome 인스턴스 생성"""
+        options = build_chrome_options(self.headless, self.user_agent)
+        try:
+            service = Service(resolve_driver_path())
+            driver = webdriver.Chrome(service=service, options=options)
+
+            # 자동화 감지 방지 스크립트
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            
+            # 목록 파싱에 필요 없는 리소스 차단
+            if BLOCK_RESOURCES:
+                block_resources(driver)
+
+            # 타임아웃 설정
+            driver.set_page_load_timeout(self.timeout)
+            driver.implicitly_wait(10)
+
+            logger.info("Chrome 드라이버가 성공적으로 설정되었습니다.")
+            return PooledDriver(driver)
+        except Exception as e:
+            logger.error(f"드라이버 설정 실패: {e}")
+            raise
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        """드라이버 응답 여부 확인"""
+        try:
+            return pooled.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _quit(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.debug(f"드라이버 종료 중 오류: {e}")
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        """드라이버 대여 (모두 사용 중이면 반납될 때까지 대기)"""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("드라이버 풀이 종료되었습니다.")
+                if self._idle:
+                    pooled = self._idle.pop()
+                    break
+                if self._total < self.size:
+                    self._total += 1
+                    pooled = None
+                    break
+                if not self._cond.wait(timeout):
+                    raise TimeoutError("사용 가능한 드라이버가 없습니다.")
+
+        if pooled is not None:
+            if self._is_healthy(pooled):
+                return pooled
+            logger.warning("응답하지 않는 드라이버를 교체합니다.")
+            self._quit(pooled)
+
+        try:
+            return self._create_driver()
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify()
+            raise
+
+    def release(self, pooled: PooledDriver):
+        """드라이버 반납 (오류가 났거나 수명이 다한 드라이버는 종료)"""
+        recycle = pooled.broken or pooled.pages_served >= self.max_pages_per_driver
+        with self._cond:
+            if recycle or self._closed:
+                self._total -= 1
+            else:
+                self._idle.append(pooled)
+            self._cond.notify()
+
+        if recycle or self._closed:
+            if not pooled.broken:
+                logger.info(f"드라이버 재활용: {pooled.pages_served}페이지 처리")
+            self._quit(pooled)
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None):
+        """with 문으로 드라이버를 빌리고 자동 반납"""
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled
+        except WebDriverException:
+            pooled.broken = True
+            raise
+        finally:
+            self.release(pooled)
+
+    def warm_up(self, count: Optional[int] = None):
+        """드라이버를 미리 띄워 둠"""
+        count = min(count or self.size, self.size)
+        leased = []
+        try:
+            for _ in range(count):
+                leased.append(self.acquire(timeout=0))
+        except Exception as e:
+            logger.debug(f"드라이버 예열 중단: {e}")
+        finally:
+            for pooled in leased:
+                self.release(pooled)
+
+    def close(self):
+        """모든 유휴 드라이버 종료"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+
+        for pooled in idle:
+            self._quit(pooled)
+
+_pools: Dict[Tuple, ChromeDriverPool] = {}
+_pools_lock = threading.Lock()
+
+def get_driver_pool(headless=True, timeout=30, user_agent=None) -> ChromeDriverPool:
+    """설정별 프로세스 공용 드라이버 풀"""
+    key = (headless, timeout, user_agent)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ChromeDriverPool(headless=headless, timeout=timeout, user_agent=user_agent)
+            _pools[key] = pool
+        return pool
+
+@atexit.register
+def close_all_pools():
+    """프로세스 종료 시 모든 드라이버 정리"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+
+    for pool in pools:
+        pool.close()
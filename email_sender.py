@@ -9,6 +9,8 @@ import os
 from dotenv import load_dotenv
 from datetime import datetime
 import streamlit as st
+from contest_store import ContestStore
+from contest_rules import filter_contests
 
 # 환경변수 로드
 load_dotenv()
@@ -267,6 +269,16 @@ def send_email(df, receiver_email):
         error_msg = f"이메일 발송 중 오류가 발생했습니다: {str(e)}"
         return False, error_msg
 
+def send_stored_contests(receiver_email, from_date=None, to_date=None, keyword=None, store=None):
+    """저장소에서 마감일 범위의 공모전을 조회해 발송 (크롤링 없음)"""
+    store = store or ContestStore()
+    df = filter_contests(store.query(keyword, from_date or datetime.now().date(), to_date), from_date, to_date)
+    
+    if df.empty:
+        return False, "저장소에 해당 기간의 공모전이 없습니다."
+    
+    return send_email(df, receiver_email)
+
 # Streamlit에서 사용할 함수
 def send_email_streamlit(df, receiver_email):
     """Streamlit에서 사용하는 이메일 발송 함수"""
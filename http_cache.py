@@ -0,0 +1,148 @@
+# http_cache.py - 목록 페이지용 디스크 HTTP 캐시
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Optional, Dict
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.getenv('WEVITY_CACHE_DIR', '.wevity_cache')
+DEFAULT_TTL = int(os.getenv('WEVITY_CACHE_TTL', '600'))  # 초 단위 신선도 유지 시간
+
+def normalize_url(url: str) -> str:
+    """캐시 키로 사용할 URL 정규화 (스킴/호스트 소문자, 쿼리 정렬, fragment 제거)"""
+    parts = urlsplit(url.strip())
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', query, ''))
+
+class HttpCache:
+    """ETag/Last-Modified 기반 조건부 재검증을 지원하는 디스크 캐시
+
+    응답 본문과 검증용 헤더를 정규화된 URL 단위로 저장합니다.
+    ttl 이내의 항목은 네트워크 없이 바로 반환하고, 만료된 항목은
+    조건부 GET으로 재검증하여 304 응답이면 저장된 본문을 재사용합니다.
+
+    같은 프로세스의 스레드(대시보드 세션, 사전 수집)는 키별 잠금으로 읽기/쓰기를 직렬화하고,
+    메타데이터는 본문 뒤에 쓰며 본문 크기를 기록해 다른 프로세스가 쓰는 중인 짝이 맞지 않는
+    본문은 읽지 않습니다.
+    """
+
+    _locks: Dict[str, threading.Lock] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttl=DEFAULT_TTL):
+        self.cache_dir = os.path.join(cache_dir, 'http')
+        self.ttl = ttl
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha1(normalize_url(url).encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.json', base + '.body'
+
+    def _lock(self, path) -> threading.Lock:
+        """캐시 항목(메타데이터 경로)별 프로세스 공용 잠금"""
+        with self._locks_guard:
+            lock = self._locks.get(path)
+            if lock is None:
+                lock = self._locks[path] = threading.Lock()
+            return lock
+
+    def _write_atomic(self, path, data: bytes):
+        # 임시 파일 이름을 호출마다 다르게 만들어 스레드/프로세스가 서로의 임시 파일을 덮어쓰지 않게 함
+        with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix='.tmp', delete=False) as f:
+            f.write(data)
+        try:
+            os.replace(f.name, path)
+        except OSError:
+            os.remove(f.name)
+            raise
+
+    def get(self, url) -> Optional[Dict]:
+        """저장된 항목 조회 (메타데이터 + 본문)"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with self._lock(meta_path):
+                with open(meta_path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                with open(body_path, 'rb') as f:
+                    entry['body'] = f.read()
+        except (OSError, ValueError):
+            return None
+        if entry.get('size') is not None and entry['size'] != len(entry['body']):
+            return None  # 다른 프로세스가 본문을 갱신하는 중
+        return entry
+
+    def put(self, url, body: bytes, etag=None, last_modified=None):
+        """응답 본문과 검증용 헤더 저장"""
+        meta_path, body_path = self._paths(url)
+        meta = {
+            'url': normalize_url(url),
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': time.time(),
+            'size': len(body),
+        }
+        try:
+            with self._lock(meta_path):
+                self._write_atomic(body_path, body)
+                self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"캐시 저장 실패: {e}")
+
+    def touch(self, entry):
+        """304 응답 후 신선도 시간 갱신"""
+        meta_path, _ = self._paths(entry['url'])
+        meta = {k: v for k, v in entry.items() if k != 'body'}
+        meta['fetched_at'] = time.time()
+        try:
+            with self._lock(meta_path):
+                self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"캐시 갱신 실패: {e}")
+
+    def is_fresh(self, entry) -> bool:
+        return time.time() - entry.get('fetched_at', 0) < self.ttl
+
+    def fetch(self, session, url, timeout=15) -> bytes:
+        """캐시를 거쳐 페이지 본문 가져오기"""
+        entry = self.get(url)
+        if entry and self.is_fresh(entry):
+            logger.debug(f"캐시 적중: {url}")
+            return entry['body']
+
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = session.get(url, timeout=timeout, headers=headers)
+
+        if response.status_code == 304 and entry:
+            logger.debug(f"캐시 재검증 (304): {url}")
+            self.touch(entry)
+            return entry['body']
+
+        response.raise_for_status()
+        self.put(
+            url,
+            response.content,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified')
+        )
+        return response.content
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        for name in os.listdir(self.cache_dir):
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
@@ -0,0 +1,123 @@
+# prefetch_scheduler.py - 추천 키워드 백그라운드 사전 수집
+import os
+import time
+import uuid
+import random
+import logging
+import threading
+from datetime import datetime
+from typing import Optional, List
+from contest_store import ContestStore
+from wevity_crawler import crawl_many
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFETCH_KEYWORDS = [
+    "공공데이터", "AI", "빅데이터", "스타트업",
+    "디자인", "영상", "사진", "아이디어",
+    "창업", "대학생", "청년", "혁신"
+]
+
+PREFETCH_ENABLED = os.getenv('WEVITY_PREFETCH_ENABLED', '1') == '1'
+DEFAULT_PREFETCH_INTERVAL = int(os.getenv('WEVITY_PREFETCH_INTERVAL', '1800'))  # 초 단위 재수집 주기
+DEFAULT_PREFETCH_JITTER = float(os.getenv('WEVITY_PREFETCH_JITTER', '0.2'))  # 주기의 ±비율
+DEFAULT_PREFETCH_PAGES = int(os.getenv('WEVITY_PREFETCH_PAGES', '2'))
+
+LOCK_NAME = 'prefetch_scheduler'
+
+def prefetch_keywords() -> List[str]:
+    """사전 수집할 키워드 목록 (WEVITY_PREFETCH_KEYWORDS에 쉼표로 지정 가능)"""
+    configured = os.getenv('WEVITY_PREFETCH_KEYWORDS')
+    if not configured:
+        return list(DEFAULT_PREFETCH_KEYWORDS)
+    return [kw.strip() for kw in configured.split(',') if kw.strip()]
+
+def format_data_age(crawled_at: Optional[datetime]) -> str:
+    """마지막 수집 시각을 '3분 전' 형태로 표시"""
+    if crawled_at is None:
+        return "수집 기록 없음"
+
+    minutes = int((datetime.now() - crawled_at).total_seconds() // 60)
+    if minutes < 1:
+        return "방금 수집"
+    if minutes < 60:
+        return f"{minutes}분 전 수집"
+    if minutes < 60 * 24:
+        return f"{minutes // 60}시간 전 수집"
+    return f"{minutes // (60 * 24)}일 전 수집"
+
+class PrefetchScheduler:
+    """키워드 목록을 주기적으로 다시 수집해 저장소를 최신으로 유지하는 백그라운드 스레드
+
+    주기에 무작위 편차(jitter)를 두어 요청이 한꺼번에 몰리지 않게 하고, 저장소의 임대 잠금으로
+    여러 대시보드 프로세스가 떠 있어도 한 인스턴스만 수집합니다. 마지막 수집이 interval보다
+    오래된 키워드만 다시 수집합니다.
+    """
+
+    def __init__(self, keywords=None, max_pages=DEFAULT_PREFETCH_PAGES, interval=DEFAULT_PREFETCH_INTERVAL,
+                 jitter=DEFAULT_PREFETCH_JITTER, store: Optional[ContestStore] = None):
+        self.keywords = keywords or prefetch_keywords()
+        self.max_pages = max_pages
+        self.interval = interval
+        self.jitter = jitter
+        self.store = store or ContestStore()
+        self.owner = uuid.uuid4().hex
+        self.lock_ttl = interval * (1 + jitter) * 2  # 한 주기를 건너뛰어도 유지되도록 넉넉하게
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _next_delay(self) -> float:
+        return self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def run_once(self) -> int:
+        """오래된 키워드 수집, 수집한 키워드 수 반환"""
+        stale = [kw for kw in self.keywords if self.store.is_stale(kw, self.interval)]
+        if not stale:
+            return 0
+
+        logger.info(f"추천 키워드 사전 수집: {', '.join(stale)}")
+        start = time.time()
+        df = crawl_many(stale, self.max_pages, store=self.store, apply_filter=False)
+        logger.info(f"사전 수집 완료: {len(stale)}개 키워드, {len(df)}개 공모전 ({time.time() - start:.1f}초)")
+        return len(stale)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self.store.acquire_lock(LOCK_NAME, self.owner, self.lock_ttl):
+                    self.run_once()
+                else:
+                    logger.debug("다른 인스턴스가 사전 수집 중입니다.")
+            except Exception as e:
+                logger.warning(f"사전 수집 실패: {e}")
+            self._stop.wait(self._next_delay())
+
+        try:
+            self.store.release_lock(LOCK_NAME, self.owner)
+        except Exception as e:
+            logger.debug(f"잠금 해제 실패: {e}")
+
+    def start(self):
+        """백그라운드 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='wevity-prefetch', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """스레드 종료 요청 (진행 중인 수집은 끝까지 진행)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+if __name__ == "__main__":
+    # 대시보드와 별도 프로세스로 실행: python prefetch_scheduler.py
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    scheduler = PrefetchScheduler()
+    scheduler.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        scheduler.stop()
@@ -0,0 +1,150 @@
+# rate_limiter.py - 응답에 따라 속도를 조절하는 공유 요청 제한기
+import os
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict
+import requests
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INITIAL_RATE = float(os.getenv('WEVITY_RATE_INITIAL', '2.0'))  # 초당 요청 수
+DEFAULT_MIN_RATE = float(os.getenv('WEVITY_RATE_MIN', '0.2'))
+DEFAULT_MAX_RATE = float(os.getenv('WEVITY_RATE_MAX', '10.0'))
+DEFAULT_BURST = int(os.getenv('WEVITY_RATE_BURST', '4'))
+DEFAULT_TARGET_LATENCY = float(os.getenv('WEVITY_TARGET_LATENCY', '1.5'))  # 이보다 느리면 속도를 줄임
+MAX_RETRY_AFTER = 300  # 서버가 요청한 대기 시간 상한 (초)
+
+THROTTLE_STATUS_CODES = (429, 500, 502, 503, 504)
+
+def parse_retry_after(value) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환"""
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        seconds = float(value)
+    else:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+class AdaptiveRateLimiter:
+    """AIMD 방식으로 속도를 조절하는 스레드 안전 토큰 버킷
+
+    빠른 성공 응답이 이어지면 초당 요청 수를 조금씩 늘리고(가산 증가), 응답이 느려지면
+    조금, 429/5xx나 연결 오류가 나면 절반으로 줄입니다(승산 감소). Retry-After를 받으면
+    그 시간 동안 모든 요청을 멈춥니다.
+    """
+
+    def __init__(self, rate=DEFAULT_INITIAL_RATE, min_rate=DEFAULT_MIN_RATE, max_rate=DEFAULT_MAX_RATE,
+                 burst=DEFAULT_BURST, target_latency=DEFAULT_TARGET_LATENCY,
+                 increase=0.5, slow_factor=0.8, error_factor=0.5):
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.burst = max(1, burst)
+        self.target_latency = target_latency
+        self.increase = increase  # 초당 증가량 (요청마다 increase / rate씩)
+        self.slow_factor = slow_factor
+        self.error_factor = error_factor
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """요청 하나를 보낼 수 있을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def _decrease(self, factor, reason):
+        old_rate = self.rate
+        self.rate = max(self.min_rate, self.rate * factor)
+        if self.rate < old_rate:
+            logger.info(f"요청 속도 감소 ({reason}): {old_rate:.2f} → {self.rate:.2f}회/초")
+
+    def record(self, latency: Optional[float] = None, status_code: Optional[int] = None, retry_after=None):
+        """응답 결과 반영 (status_code가 없으면 상태를 알 수 없는 성공으로 간주)"""
+        delay = parse_retry_after(retry_after)
+        with self._lock:
+            if delay:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+                logger.warning(f"서버 요청으로 {delay:.0f}초 대기합니다 (Retry-After).")
+
+            if status_code in THROTTLE_STATUS_CODES:
+                self._decrease(self.error_factor, f"HTTP {status_code}")
+            elif status_code is not None and status_code >= 400:
+                return  # 404 등은 속도와 무관
+            elif latency is not None and latency > self.target_latency:
+                self._decrease(self.slow_factor, f"응답 {latency:.1f}초")
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def record_error(self):
+        """연결 오류/타임아웃 반영"""
+        with self._lock:
+            self._decrease(self.error_factor, "연결 오류")
+
+    @contextmanager
+    def track(self):
+        """with 문 안의 요청을 제한하고 소요 시간/오류를 반영 (Selenium 등 상태 코드가 없는 경로용)"""
+        self.acquire()
+        start = time.monotonic()
+        try:
+            yield
+        except Exception:
+            self.record_error()
+            raise
+        self.record(time.monotonic() - start)
+
+class RateLimitedSession(requests.Session):
+    """모든 요청이 공유 제한기를 거치는 requests 세션"""
+
+    def __init__(self, limiter: AdaptiveRateLimiter):
+        super().__init__()
+        self.limiter = limiter
+
+    def request(self, method, url, *args, **kwargs):
+        self.limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.RequestException:
+            self.limiter.record_error()
+            raise
+        self.limiter.record(time.monotonic() - start, response.status_code, response.headers.get('Retry-After'))
+        return response
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(host: str) -> AdaptiveRateLimiter:
+    """호스트별 프로세스 공용 제한기"""
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter()
+            _limiters[host] = limiter
+        return limiter
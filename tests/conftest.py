@@ -0,0 +1,5 @@
+# conftest.py - 저장소 루트의 모듈(wevity_crawler, contest_rules 등)을 테스트에서 불러올 수 있게 함
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
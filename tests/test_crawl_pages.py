@@ -0,0 +1,120 @@
+# test_crawl_pages.py - 목록 페이지 수집이 페이지 이동(gp=)에 흔들리지 않는지 확인 (증분 워터마크, 중복 제거)
+import asyncio
+
+from contest_model import Contest, build_contest_frame
+from contest_rules import NO_HOST_TEXT, normalize_contest_link
+from http_cache import HttpCache
+import wevity_crawler
+from wevity_crawler import WevityCrawler, CrawlWatermark
+
+PAGE_SIZE = 3
+KEYWORD = '공공데이터'
+
+def board_page(contest_ids, page):
+    """공모전 번호 목록으로 게시판형 목록 페이지 생성 (링크에 gp=/sw=가 붙는 실제 목록과 같은 형태)"""
+    rows = ''.join(
+        f'<tr><td>{ix}</td>'
+        f'<td class="subject"><a href="/?c=find&amp;s=1&amp;gbn=view&amp;gp={page}&amp;ix={ix}&amp;sw={KEYWORD}">'
+        f'공모전 {ix}</a></td>'
+        f'<td class="company">주최 {ix}</td><td class="date">마감: 2099.12.31</td></tr>'
+        for ix in contest_ids
+    )
+    return f'<html><body><table class="board_list"><tbody>{rows}</tbody></table></body></html>'.encode('utf-8')
+
+def serve(crawler, contest_ids, pages=None):
+    """contest_ids를 PAGE_SIZE개씩 나눠 목록 페이지로 응답 (pages가 있으면 {페이지: 공모전 번호 목록} 그대로)"""
+    def get_page(url):
+        page = int(url.split('gp=')[1].split('&')[0])
+        if pages is not None:
+            return board_page(pages.get(page, []), page)
+        start = (page - 1) * PAGE_SIZE
+        return board_page(contest_ids[start:start + PAGE_SIZE], page)
+
+    crawler._get_page_with_requests = get_page
+
+def crawl_pages(crawler, max_pages, incremental=False):
+    async def collect():
+        return [contest_info async for contests in crawler.aiter_pages(KEYWORD, max_pages, incremental=incremental)
+                for contest_info in contests]
+    return asyncio.run(collect())
+
+def crawl_incremental(crawler, max_pages):
+    return crawl_pages(crawler, max_pages, incremental=True)
+
+def test_shifted_contests_stay_known(tmp_path):
+    crawler = WevityCrawler(watermark=CrawlWatermark(str(tmp_path / 'watermarks.json')), parse_workers=1)
+    contest_ids = [9000 + n for n in range(9)]
+
+    serve(crawler, contest_ids)
+    assert len(crawl_incremental(crawler, 3)) == 9
+
+    # 새 공모전 하나가 맨 앞에 들어와 모든 공모전이 한 칸씩 밀림 (1페이지 끝 → 2페이지 처음)
+    serve(crawler, [9100] + contest_ids)
+    new_contests = crawl_incremental(crawler, 3)
+
+    assert [contest_info.title for contest_info in new_contests] == ['공모전 9100']
+
+def test_contest_on_two_pages_is_collected_once(tmp_path):
+    """시점이 다른 캐시 페이지를 받으면 같은 공모전이 gp=1과 gp=2 링크로 모두 나올 수 있음"""
+    crawler = WevityCrawler(watermark=CrawlWatermark(str(tmp_path / 'watermarks.json')), parse_workers=1)
+    serve(crawler, None, pages={1: [9100, 9000, 9001], 2: [9001, 9002, 9003]})
+
+    titles = [contest_info.title for contest_info in crawl_pages(crawler, 2)]
+
+    assert titles == ['공모전 9100', '공모전 9000', '공모전 9001', '공모전 9002', '공모전 9003']
+
+def test_contest_frame_drops_duplicate_contest_ids():
+    base = 'https://www.wevity.com/?c=find&s=1&gbn=view&ix=9001'
+    contests = [Contest(title=f'공모전 {page}', link=f'{base}&gp={page}', host='주최', period='', deadline=None,
+                        prize='') for page in (1, 2)]
+
+    df = build_contest_frame(contests, matched_keywords=['가', '나'])
+
+    assert df['contest_id'].is_unique
+    assert df['제목'].tolist() == ['공모전 1']
+    assert df['matched_keywords'].tolist() == ['가']
+
+def test_contest_found_by_two_keywords_is_merged(tmp_path):
+    """키워드마다 링크의 sw=가 달라도 같은 공모전은 한 행으로 합치고 두 키워드를 모두 기록"""
+    crawler = WevityCrawler(watermark=CrawlWatermark(str(tmp_path / 'watermarks.json')), parse_workers=1)
+
+    def get_page(url):
+        keyword = url.split('sw=')[1]
+        contest_ids = {'데이터': [9000, 9001], '디자인': [9001, 9002]}[keyword] if url.count('gp=1&') else []
+        return board_page(contest_ids, 1).replace(KEYWORD.encode('utf-8'), keyword.encode('utf-8'))
+
+    crawler._get_page_with_requests = get_page
+    df = crawler.crawl_many(['데이터', '디자인'], max_pages=2)
+
+    assert df['제목'].tolist() == ['공모전 9000', '공모전 9001', '공모전 9002']
+    assert df['matched_keywords'].tolist() == ['데이터', '데이터, 디자인', '디자인']
+
+def test_detail_page_is_fetched_once_per_contest(tmp_path):
+    """검색어·페이지만 다른 링크는 같은 상세 페이지이므로 한 번만 요청"""
+    crawler = WevityCrawler(detail_cache=HttpCache(str(tmp_path / 'detail')), parse_workers=1)
+    fetched = []
+
+    def fetch(url, cache=None):
+        fetched.append(url)
+        return '<ul class="cd-info-list"><li><span class="tit">주최</span>행정안전부</li></ul>'.encode('utf-8')
+
+    crawler._fetch_with_retry = fetch
+    base = 'https://www.wevity.com/?c=find&s=1&gbn=view&ix=9501'
+    contests = [Contest(title='공모전 9501', link=f'{base}&gp={page}&sw={keyword}', host=NO_HOST_TEXT, period='',
+                        deadline=None, prize='') for page, keyword in ((1, '데이터'), (2, '디자인'))]
+
+    enriched = crawler.enrich_contests(contests, max_workers=2)
+
+    assert fetched == [normalize_contest_link(base)]
+    assert [contest_info.host for contest_info in enriched] == ['행정안전부', '행정안전부']
+
+def test_browser_waits_for_list_containers_before_learning(monkeypatch):
+    """학습 전에는 'tr', '.item' 같은 일반 선택자가 아니라 목록 컨테이너 선택자만 기다림"""
+    monkeypatch.setattr(wevity_crawler, '_selector_cache', {})
+    selectors = wevity_crawler._item_wait_selector().split(', ')
+
+    assert selectors == wevity_crawler.CONTEST_LIST_WAIT_SELECTORS
+    assert 'tr' not in selectors and '.item' not in selectors
+
+    monkeypatch.setattr(wevity_crawler, '_selector_cache', {'fingerprint': '.board_list tr'})
+    assert wevity_crawler._item_wait_selector() == '.board_list tr'
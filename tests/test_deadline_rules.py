@@ -0,0 +1,22 @@
+# test_deadline_rules.py - 마감일 규칙 표 회귀 테스트
+#
+# fixtures/deadline_cases.json의 기대값은 규칙 표로 옮기기 전 크롤러(_extract_deadline)가
+# 기준 날짜 2026-10-17에 낸 결과입니다. 규칙을 바꾸면 이 표와 같은 결과를 내야 합니다.
+import json
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from contest_rules import parse_deadline
+
+CORPUS = json.loads((Path(__file__).parent / 'fixtures' / 'deadline_cases.json').read_text(encoding='utf-8'))
+TODAY = date.fromisoformat(CORPUS['today'])
+
+@pytest.mark.parametrize('text, expected', CORPUS['cases'])
+def test_parse_deadline_matches_baseline(text, expected):
+    deadline = parse_deadline(text, TODAY)
+    assert (deadline.date().isoformat() if deadline else None) == expected
+
+def test_parse_deadline_ignores_whitespace_layout():
+    assert parse_deadline("  2026.10.17   ~  \n 2026.11.09 ", TODAY) == parse_deadline("2026.10.17 ~ 2026.11.09", TODAY)
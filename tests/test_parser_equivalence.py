@@ -0,0 +1,31 @@
+# test_parser_equivalence.py - html.parser와 lxml 트리 빌더가 같은 공모전 레코드를 만드는지 확인
+from pathlib import Path
+
+import pytest
+
+from wevity_crawler import WevityCrawler
+
+pytest.importorskip('lxml')
+
+FIXTURE_DIR = Path(__file__).parent / 'fixtures'
+LIST_PAGES = sorted(FIXTURE_DIR.glob('list_page_*.html'))
+PARSERS = ('html.parser', 'lxml')
+
+def parse_records(markup: bytes, parser: str):
+    crawler = WevityCrawler(parser=parser)
+    assert crawler.parser == parser
+    return crawler._parse_contest_markup(markup, 1)
+
+@pytest.mark.parametrize('page', LIST_PAGES, ids=lambda path: path.stem)
+def test_parsers_extract_identical_records(page):
+    markup = page.read_bytes()
+    records = {parser: parse_records(markup, parser) for parser in PARSERS}
+
+    assert records['lxml'], "저장된 목록 페이지에서 공모전을 찾지 못했습니다."
+    assert records['html.parser'] == records['lxml']
+
+@pytest.mark.parametrize('page', LIST_PAGES, ids=lambda path: path.stem)
+def test_parsers_extract_identical_records_from_text(page):
+    """Selenium 경로는 page_source 문자열을 넘기므로 문자열 입력도 확인"""
+    markup = page.read_text(encoding='utf-8')
+    assert parse_records(markup, 'html.parser') == parse_records(markup, 'lxml')
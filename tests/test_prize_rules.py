@@ -0,0 +1,62 @@
+# test_prize_rules.py - 상금 표시 문자열과 금액(상금_원)이 같은 규칙에서 나오는지 확인
+import random
+from pathlib import Path
+
+import pytest
+
+from contest_rules import normalize_prize, find_prize_text, parse_prize_amount, prize_amounts, NO_PRIZE_TEXT
+
+PRIZE_CASES = [
+    # (원문, 표시 문자열, 금액)
+    ("1등: 500만원", "1등: 500만원", 5_000_000),
+    ("1등 : 300 (만원)", "1등: 300만원", 3_000_000),
+    ("상금: 500,000", "상금: 500,000원", 500_000),
+    ("총상금3,000만원1등 상금500만원", "1등: 500만원", 5_000_000),
+    ("대상 1,000만원 최우수상 300만원", "1등: 1,000만원", 10_000_000),
+    ("총 상금 1,500만원 / 대상 500만원", "1등: 500만원", 5_000_000),
+    ("총상금 2.5억원", "총상금: 2.5억원", 250_000_000),
+    ("우승 3억원", "1등: 3억원", 300_000_000),
+    ("금상 200만원은상 100만원", "1등: 200만원", 2_000_000),
+    ("1등 5명 300만원", "300만원", 3_000_000),
+    ("1.5만원 2만 3억", "3억원", 300_000_000),
+    ("상금 5명 시상 총 1억", "1억원", 100_000_000),
+    ("참가비 10,000원", None, 0),
+    ("대상 상장", None, 0),
+    # '응모대상'·'참가대상'은 상 이름이 아니고, 1등 상금은 단위가 있어야 금액으로 봄
+    ("응모대상 누구나 D-24 접수중", None, 0),
+    ("참가대상 대학생 2026년 모집", None, 0),
+    ("대상 1~3학년 상금 500만원", "상금: 500만원", 5_000_000),
+    ("1등 5명", None, 0),
+    (NO_PRIZE_TEXT, None, 0),
+    ("", None, 0),
+]
+
+@pytest.mark.parametrize('text, display, amount', PRIZE_CASES)
+def test_display_and_amount_come_from_one_rule(text, display, amount):
+    assert find_prize_text(text) == display
+    assert parse_prize_amount(text) == amount
+    assert prize_amounts([text])[0] == amount
+
+@pytest.mark.parametrize('text, display, amount', [case for case in PRIZE_CASES if case[1]])
+def test_display_text_keeps_its_amount(text, display, amount):
+    """목록에서 저장한 표시 문자열로 다시 계산해도 같은 금액이어야 함"""
+    assert normalize_prize(display) == (display, amount)
+
+def test_list_page_prize_skips_eligibility_label():
+    """목록 항목의 '응모대상'·'D-24' 대신 '1등 상금 500만원'을 골라야 함"""
+    from wevity_crawler import WevityCrawler
+
+    markup = (Path(__file__).parent / 'fixtures' / 'list_page_contents.html').read_bytes()
+    first = WevityCrawler(parser='html.parser')._parse_contest_markup(markup, 1)[0]
+    assert first.prize == "1등: 500만원"
+    assert parse_prize_amount(first.prize) == 5_000_000
+
+def test_prize_amounts_matches_scalar_on_mixed_tokens():
+    tokens = ['1등', '대상', '상금', ':', '총 상금', '우승', '5명', '(만원)', '( 억원 )', '만원', '억', '만', '원',
+              ' ', '300', '1,000', '2.5', '100000', '500,000', ',', '.', '3팀', '참가비', '은상', '\n', '/', '50']
+    rng = random.Random(24)
+    texts = [''.join(rng.choice(tokens) for _ in range(rng.randint(1, 9))) for _ in range(5000)]
+
+    expected = [parse_prize_amount(text) for text in texts]
+    mismatches = [(text, want, got) for text, want, got in zip(texts, expected, prize_amounts(texts)) if want != got]
+    assert not mismatches[:10]
@@ -0,0 +1,85 @@
+# test_vectorized_rules.py - 벡터화 일괄 재계산이 항목 단위 규칙과 같은 결과를 내는지 확인
+import json
+import random
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from contest_rules import (parse_deadline, parse_prize_amount, deadlines_from_text, prize_amounts,
+                           normalize_contests, NO_PRIZE_TEXT)
+
+TODAY = date(2026, 10, 17)
+DEADLINE_CASES = json.loads((Path(__file__).parent / 'fixtures' / 'deadline_cases.json').read_text(encoding='utf-8'))
+
+DEADLINE_TEMPLATES = [
+    "{y}{s}{m}{s}{d}", "{y}년 {m}월 {d}일 마감", "{m}월 {d}일 ~ {m2}월 {d2}일", "접수 {y}{s}{m}{s}{d} ~ {y2}{s}{m2}{s}{d2}",
+    "D-{d}", "{m}월 {d}일 마감 D-{d2}", "마감: {y}{s}{m}{s}{d}", "{y}{s}{m}{s}{d} 마감", "까지 {y}{s}{m}{s}{d}",
+    "{y}년 {m}월 {d}일 ~ {y2}년 {m2}월 {d2}일", "{y}{s}{m}{s}{d} {y2}{s}{m2}{s}{d2}", "접수마감 {y}{s}{m}{s}{d}",
+    "{y}{s}{m}{s}{d} ~ {y2}{s}{m2}{s}{d2} D-{d}", "  {y}{s}{m}{s}{d}\n~\t{y2}{s}{m2}{s}{d2} ",
+]
+YEARS = ['2026', '2027', '2024', '2099', '1999', '0000', '25', '26', '00', '68', '69', '70', '99']
+
+PRIZE_PREFIXES = ['1등 ', '대상: ', '총상금 ', '', '우승 ', '최우수상 ', '금상 ', '상금 ']
+PRIZE_UNITS = ['만원', '억원', '원', '만', '억', '', ' 만원']
+PRIZE_SUFFIXES = ['', ' 2등 300만원', ' 총 1억', ' (총 상금 2,500만원)', ' 및 상장']
+
+def generated_deadline_texts(count=3000, seed=10):
+    rng = random.Random(seed)
+    texts = [text for text, _ in DEADLINE_CASES['cases']]
+    for _ in range(count):
+        texts.append(rng.choice(DEADLINE_TEMPLATES).format(
+            y=rng.choice(YEARS), y2=rng.choice(YEARS), s=rng.choice('.-/'),
+            m=rng.randint(0, 14), m2=rng.randint(0, 14), d=rng.randint(0, 33), d2=rng.randint(0, 33),
+        ))
+    return texts
+
+def generated_prize_texts(count=3000, seed=10):
+    rng = random.Random(seed)
+    texts = ["", NO_PRIZE_TEXT, "1등: 500만원", "대상 1,000만원 최우수상 300만원", "총상금 2.5억원", "상금 50000원",
+             "상금 300,000원 1등 100만원", "우승 3억원", "1등: 5000", "1.5만원 2만 3억", "100원", "대상 상장"]
+    for _ in range(count):
+        texts.append(rng.choice(PRIZE_PREFIXES) + f"{rng.randint(1, 9999):,}" + rng.choice(PRIZE_UNITS)
+                     + rng.choice(PRIZE_SUFFIXES))
+    return texts
+
+def test_deadlines_from_text_matches_parse_deadline():
+    texts = generated_deadline_texts()
+    expected = []
+    for text in texts:
+        deadline = parse_deadline(text, TODAY)
+        expected.append(deadline.date() if deadline else None)
+
+    # 인덱스가 기본값이 아니어도 같은 순서로 반환해야 함
+    result = deadlines_from_text(pd.Series(texts, index=range(len(texts), 0, -1)), TODAY)
+
+    mismatches = [(text, want, got) for text, want, got in zip(texts, expected, result) if want != got]
+    assert not mismatches[:10]
+    assert list(result.index) == list(range(len(texts), 0, -1))
+
+@pytest.mark.parametrize('text', ["69.01.01", "99.12.31 ~ 00.01.01", "70.5.5 ~ 99.1.1", "68.12.31", "1999.12.31"])
+def test_two_digit_years_match(text):
+    deadline = parse_deadline(text, TODAY)
+    assert deadlines_from_text([text], TODAY)[0] == (deadline.date() if deadline else None)
+
+def test_prize_amounts_matches_parse_prize_amount():
+    texts = generated_prize_texts()
+    expected = [parse_prize_amount(text) for text in texts]
+    result = prize_amounts(texts)
+
+    assert result.dtype == 'int64'
+    mismatches = [(text, want, got) for text, want, got in zip(texts, expected, result) if want != got]
+    assert not mismatches[:10]
+
+def test_normalize_contests_keeps_existing_deadline_when_text_has_none():
+    df = pd.DataFrame({
+        '제목': ['공모전 A', '공모전 B 12월 24일 마감'],
+        '기간': ['2026.10.01 ~ 2026.11.10', '기간 정보 없음'],
+        '마감일': [None, '2026-12-01'],
+        '상금': ['1등: 500만원', NO_PRIZE_TEXT],
+    })
+    result = normalize_contests(df, TODAY)
+
+    assert list(result['마감일'].dt.date) == [date(2026, 11, 10), date(2026, 12, 24)]
+    assert list(result['상금_원']) == [5_000_000, 0]
@@ -1,20 +1,31 @@
 # wevity_crawler_improved.py - 개선된 크롤러
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
+from bs4 import BeautifulSoup, FeatureNotFound
 import pandas as pd
-from datetime import datetime, timedelta
-import re
+from datetime import datetime, date
+import requests
+import os
+import json
 import time
+import random
+import asyncio
+import hashlib
 import logging
-from typing import Optional, List, Dict
-import requests
-from urllib.parse import urljoin
+import threading
+import multiprocessing
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Optional, List, Dict, Tuple, Iterator, AsyncIterator
+from urllib.parse import urljoin, urlsplit
+from http_cache import HttpCache, DEFAULT_CACHE_DIR
+from contest_rules import (parse_deadline, parse_date_string, find_prize_text, normalize_contest_link, NO_HOST_TEXT,
+                           NO_PERIOD_TEXT, NO_PRIZE_TEXT, EXCLUDE_TITLE_KEYWORDS, CLOSED_PERIOD_KEYWORDS,
+                           filter_contests)
+from contest_store import ContestStore, DEFAULT_MAX_AGE
+from contest_model import Contest, build_contest_frame, as_contest_frame
+from rate_limiter import AdaptiveRateLimiter, RateLimitedSession, get_rate_limiter, THROTTLE_STATUS_CODES
+from driver_pool import ChromeDriverPool, get_driver_pool
 
 # 로깅 설정
 logging.basicConfig(
@@ -23,15 +34,181 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+FETCH_RETRIES = int(os.getenv('WEVITY_FETCH_RETRIES', '3'))  # 일시적 오류 재시도 횟수
+RETRY_BACKOFF = float(os.getenv('WEVITY_RETRY_BACKOFF', '0.5'))  # 첫 재시도 대기 시간 (초, 매번 두 배)
+# 목록 페이지 파싱 프로세스 수 (1 이하면 항상 현재 프로세스에서 파싱)
+PARSE_WORKERS = int(os.getenv('WEVITY_PARSE_WORKERS', str(min(4, os.cpu_count() or 1))))
+PARSE_POOL_MIN_PAGES = int(os.getenv('WEVITY_PARSE_POOL_MIN_PAGES', '6'))  # 이보다 작은 작업은 현재 프로세스에서 파싱
+DETAIL_WORKERS = int(os.getenv('WEVITY_DETAIL_WORKERS', '4'))  # 상세 페이지를 동시에 가져올 스레드 수
+
+class CrawlFetchError(Exception):
+    """검색 결과 페이지를 하나도 가져오지 못함 (검색 결과 없음과 구분)"""
+
+def _is_transient_error(error) -> bool:
+    """재시도할 만한 오류인지 (연결 오류, 타임아웃, 429/5xx)"""
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in THROTTLE_STATUS_CODES
+    return False
+
+def contest_fingerprint(contest_info: Contest) -> str:
+    """공모전 내용 지문 (변경 여부 판단용)"""
+    deadline = contest_info.deadline
+    fields = [
+        contest_info.title,
+        contest_info.host,
+        contest_info.period,
+        contest_info.prize,
+        deadline.isoformat() if deadline else '',
+    ]
+    return hashlib.sha1('\x1f'.join(fields).encode('utf-8')).hexdigest()[:16]
+
+class CrawlWatermark:
+    """키워드별로 이미 수집한 공모전 링크와 내용 지문을 저장 (증분 크롤링용)"""
+    
+    def __init__(self, path=os.path.join(DEFAULT_CACHE_DIR, 'watermarks.json')):
+        self.path = path
+        self._lock = threading.Lock()
+    
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def load(self, keyword) -> Dict[str, str]:
+        """키워드의 {링크: 지문} 조회"""
+        with self._lock:
+            return self._read().get(keyword.strip(), {})
+    
+    def _write(self, data):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"워터마크 저장 실패: {e}")
+    
+    def update(self, keyword, fingerprints: Dict[str, str]):
+        """새로 확인한 링크와 지문 반영"""
+        with self._lock:
+            data = self._read()
+            data.setdefault(keyword.strip(), {}).update(fingerprints)
+            self._write(data)
+    
+    def clear(self, keyword=None):
+        """워터마크 초기화 (keyword가 없으면 전체, 있으면 그 키워드의 기간별 워터마크까지)"""
+        with self._lock:
+            data = {}
+            if keyword:
+                keyword = keyword.strip()
+                data = {key: value for key, value in self._read().items()
+                        if key != keyword and not key.startswith(f"{keyword}|")}
+            self._write(data)
+
+def _resolve_parser(parser=None) -> str:
+    """사용할 HTML 파서 결정 (기본: lxml, 없으면 html.parser)"""
+    candidates = [parser] if parser else []
+    candidates += [os.getenv('WEVITY_HTML_PARSER', 'lxml'), 'html.parser']
+    
+    for name in candidates:
+        try:
+            BeautifulSoup('', name)
+            return name
+        except FeatureNotFound:
+            logger.warning(f"HTML 파서 '{name}'를 사용할 수 없습니다.")
+    return 'html.parser'
+
+# 공모전 목록 아이템 선택자 (앞에서부터 시도)
+CONTEST_ITEM_SELECTORS = [
+    "ul.list li",
+    ".list li", 
+    ".contest_list li",
+    ".board_list tr",
+    "tr",
+    ".item",
+    "div[class*='item']",
+    "div[class*='contest']",
+    "li[class*='list']"
+]
+
+# 브라우저에서 목록이 나타났는지 기다릴 때 쓰는 선택자 (학습 전) - 목록 컨테이너가 있는 선택자만 사용
+# ('tr', '.item' 같은 일반 선택자는 목록 전에 그려지는 요소에도 맞으므로 _find_contest_items에서만 시도)
+CONTEST_LIST_WAIT_SELECTORS = [
+    "ul.list li",
+    ".list li",
+    ".contest_list li",
+    ".board_list tr",
+]
+
+# DOM 지문별로 성공한 선택자 기억 (프로세스 공용)
+_selector_cache: Dict[str, str] = {}
+_selector_cache_lock = threading.Lock()
+_SELECTOR_CACHE_SIZE = 64
+
+# 브라우저 페이지 준비 판단 - 목록 선택자가 나타나면 준비된 것으로 봄
+PAGE_READY_SCRIPT = "return document.querySelector(arguments[0]) !== null;"
+# 목록이 없는 페이지(검색 결과 없음 등)는 유예 시간이 지난 뒤 문서 로딩 완료로 판단
+PAGE_LOADED_SCRIPT = "return document.readyState === 'complete';"
+PAGE_READY_TIMEOUT = 10
+PAGE_READY_GRACE = float(os.getenv('WEVITY_PAGE_READY_GRACE', '2.0'))  # 초
+PAGE_READY_POLL = 0.1
+
+def _item_wait_selector() -> str:
+    """브라우저에서 기다릴 목록 선택자 (학습된 선택자가 있으면 그것만 최근 것부터, 없으면 목록 컨테이너 선택자)"""
+    with _selector_cache_lock:
+        learned = list(dict.fromkeys(reversed(list(_selector_cache.values()))))
+    return ', '.join(learned or CONTEST_LIST_WAIT_SELECTORS)
+
+def _dom_fingerprint(soup) -> str:
+    """페이지 구조 지문 - 클래스가 있는 목록/표 요소의 태그와 클래스 조합"""
+    signature = sorted({
+        f"{element.name}.{'.'.join(element.get('class', []))}"
+        for element in soup.find_all(('ul', 'ol', 'table'), class_=True)
+    })
+    return hashlib.sha1('|'.join(signature).encode('utf-8')).hexdigest()[:16]
+
+def _remember_selector(fingerprint, selector):
+    with _selector_cache_lock:
+        _selector_cache.pop(fingerprint, None)
+        _selector_cache[fingerprint] = selector
+        while len(_selector_cache) > _SELECTOR_CACHE_SIZE:
+            _selector_cache.pop(next(iter(_selector_cache)))
+
+# 상세 페이지 항목 이름 → 공모전 필드
+DETAIL_ROW_SELECTORS = ["ul.cd-info-list li", ".cd-info-list li", "ul.info li", "dl.info"]
+PRIZE_CHARS = ('원', '만', '억', '$')
+
+# 상세 페이지에서 추출한 필드 (링크별, 프로세스 공용, 최근 사용 순으로 일부만 유지하고 나머지는 디스크 캐시에서 다시 읽음)
+_detail_fields: Dict[str, Dict[str, str]] = {}
+_detail_fields_lock = threading.Lock()
+_DETAIL_FIELDS_CACHE_SIZE = 2048
+
 class WevityCrawler:
     """Wevity 공모전 크롤러 클래스 - 개선 버전"""
     
-    def __init__(self, headless=True, timeout=30):
+    def __init__(self, headless=True, timeout=30, max_concurrency=4, http_cache: Optional[HttpCache] = None,
+                 driver_pool: Optional[ChromeDriverPool] = None, watermark: Optional[CrawlWatermark] = None,
+                 parser: Optional[str] = None, detail_cache: Optional[HttpCache] = None, apply_filter=True,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None, parse_workers=PARSE_WORKERS,
+                 detail_workers=DETAIL_WORKERS):
         self.base_url = "https://www.wevity.com"
         self.timeout = timeout
-        self.driver = None
         self.headless = headless
-        self.session = requests.Session()
+        self.max_concurrency = max(1, max_concurrency)  # 동시에 가져올 최대 페이지 수
+        self.http_cache = http_cache  # None이면 매번 새로 요청
+        self.parser = _resolve_parser(parser)  # BeautifulSoup 트리 빌더 ('lxml', 'html.parser' 등)
+        self.detail_cache = detail_cache  # 상세 페이지 캐시 (None이면 프로세스 공용 캐시)
+        self.apply_filter = apply_filter  # False면 중복만 제거하고 날짜/키워드 필터링은 호출자가 적용 (filter_contests)
+        # 목록/상세/Selenium 요청 모두 같은 호스트의 공용 제한기를 거침
+        self.rate_limiter = rate_limiter or get_rate_limiter(urlsplit(self.base_url).netloc)
+        self.session = RateLimitedSession(self.rate_limiter)
+        self.parse_workers = parse_workers  # 목록 페이지 파싱 프로세스 수 (큰 작업에만 사용)
+        self.detail_workers = max(1, detail_workers)  # 상세 페이지 보강 스레드 수
         
         # User-Agent 설정
         self.headers = {
@@ -39,191 +216,81 @@ class WevityCrawler:
         }
         self.session.headers.update(self.headers)
         
-    def _setup_driver(self):
-        """Chrome 드라이버 설정 - 개선된 버전"""
-        options = Options()
-        
-        # 기본 옵션
-        if self.headless:
-            options.add_argument('--headless=new')  # 새로운 headless 모드
+        # Selenium 드라이버는 직접 소유하지 않고 풀에서 빌려 사용
+        self.driver_pool = driver_pool
         
-        # 안정성 개선 옵션들
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-plugins')
-        options.add_argument('--disable-images')  # 이미지 로딩 비활성화로 속도 개선
-        options.add_argument('--window-size=1920,1080')
-        
-        # User-Agent 설정
-        options.add_argument(f'--user-agent={self.headers["User-Agent"]}')
+        # 마감일 계산 기준 날짜 (크롤링마다 한 번 정함)
+        self.today: Optional[date] = None
         
-        # 자동화 감지 방지
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
+        # 증분 크롤링용 워터마크 (incremental=True일 때만 사용)
+        self.watermark = watermark or CrawlWatermark()
         
-        # 페이지 로딩 전략
-        options.page_load_strategy = 'eager'  # DOM이 준비되면 바로 진행
-        
-        try:
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=options)
-            
-            # 자동화 감지 방지 스크립트
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            # 타임아웃 설정
-            self.driver.set_page_load_timeout(self.timeout)
-            self.driver.implicitly_wait(10)
-            
-            logger.info("Chrome 드라이버가 성공적으로 설정되었습니다.")
-            return True
-            
-        except Exception as e:
-            logger.error(f"드라이버 설정 실패: {e}")
-            return False
+    def _get_driver_pool(self) -> ChromeDriverPool:
+        """사용할 드라이버 풀 (지정하지 않으면 프로세스 공용 풀)"""
+        if self.driver_pool is None:
+            self.driver_pool = get_driver_pool(self.headless, self.timeout, self.headers['User-Agent'])
+        return self.driver_pool
+    
+    def _today(self) -> date:
+        """이번 크롤링의 기준 날짜"""
+        return self.today or datetime.now().date()
     
     def _extract_deadline(self, text: str) -> Optional[datetime]:
         """텍스트에서 마감일 추출 - 개선된 정규식"""
-        if not text:
-            return None
-            
-        # 텍스트 정리
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        # 마감된 공모전 키워드 체크 (먼저 체크해서 빠르게 제외)
-        if any(keyword in text.lower() for keyword in ['마감됨', '접수마감', '종료됨', '완료됨']):
-            return datetime(2020, 1, 1)  # 과거 날짜로 설정하여 필터링되도록
-        
-        # 1. 접수기간 형태 패턴들
-        period_patterns = [
-            # 2025.01.01 ~ 2025.03.15
-            r'(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})\s*[~\-까지]\s*(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})',
-            # 25.01.01 ~ 25.03.15
-            r'(\d{2}[.\-/]\d{1,2}[.\-/]\d{1,2})\s*[~\-까지]\s*(\d{2}[.\-/]\d{1,2}[.\-/]\d{1,2})',
-            # 1월 1일 ~ 3월 15일
-            r'(\d{1,2})월\s*(\d{1,2})일\s*[~\-까지]\s*(\d{1,2})월\s*(\d{1,2})일',
-            # 2025년 1월 1일 ~ 2025년 3월 15일
-            r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*[~\-까지]\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',
-        ]
-        
-        for pattern in period_patterns:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    if '년' in pattern:  # 2025년 1월 1일 형태
-                        end_year = int(match.group(4))
-                        end_month = int(match.group(5))
-                        end_day = int(match.group(6))
-                        return datetime(end_year, end_month, end_day)
-                    elif '월' in pattern:  # 한글 날짜 형태
-                        end_month = int(match.group(3))
-                        end_day = int(match.group(4))
-                        current_year = datetime.now().year
-                        return datetime(current_year, end_month, end_day)
-                    else:
-                        end_date_str = match.group(2)
-                        return self._parse_date_string(end_date_str)
-                except (ValueError, IndexError):
-                    continue
-        
-        # 2. 단일 마감일 형태
-        single_patterns = [
-            r'마감\s*:?\s*(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})',
-            r'까지\s*:?\s*(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})',
-            r'(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})\s*마감',
-            r'접수마감\s*:?\s*(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})',
-            r'(\d{1,2})월\s*(\d{1,2})일\s*마감',
-            r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*마감',
-            r'마감일\s*:?\s*(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})',
-        ]
-        
-        for pattern in single_patterns:
-            match = re.search(pattern, text)
-            if match:
-                try:
-                    if '년' in pattern:
-                        year = int(match.group(1))
-                        month = int(match.group(2))
-                        day = int(match.group(3))
-                        return datetime(year, month, day)
-                    elif '월' in pattern:
-                        month = int(match.group(1))
-                        day = int(match.group(2))
-                        current_year = datetime.now().year
-                        return datetime(current_year, month, day)
-                    else:
-                        return self._parse_date_string(match.group(1))
-                except (ValueError, IndexError):
-                    continue
-        
-        # 3. D-day 형태
-        d_match = re.search(r'D[－\-](\d+)', text)
-        if d_match:
-            days_left = int(d_match.group(1))
-            return datetime.now() + timedelta(days=days_left)
-        
-        # 4. 단순 날짜 형태 (마지막에 체크)
-        simple_date_patterns = [
-            r'(\d{4}[.\-/]\d{1,2}[.\-/]\d{1,2})',
-            r'(\d{2}[.\-/]\d{1,2}[.\-/]\d{1,2})',
-        ]
-        
-        for pattern in simple_date_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                # 여러 날짜가 있으면 가장 늦은 날짜를 마감일로 간주
-                dates = []
-                for match in matches:
-                    parsed = self._parse_date_string(match)
-                    if parsed and parsed.year >= datetime.now().year:
-                        dates.append(parsed)
-                
-                if dates:
-                    return max(dates)
-        
-        return None
+        return parse_deadline(text, self._today())
     
     def _parse_date_string(self, date_str: str) -> Optional[datetime]:
         """날짜 문자열을 datetime 객체로 변환"""
-        if not date_str:
-            return None
-            
-        # 구분자 통일
-        date_str = re.sub(r'[.\-/]', '.', date_str)
-        
-        # 날짜 형식들
-        formats = [
-            '%Y.%m.%d',
-            '%y.%m.%d',
-            '%Y.%m.%d',
-        ]
+        return parse_date_string(date_str)
+    
+    def _fetch_with_retry(self, url: str, cache: Optional[HttpCache] = None) -> bytes:
+        """페이지 본문 가져오기 - 일시적 오류는 지수 백오프로 재시도
         
-        for fmt in formats:
+        재시도 전 대기 시간은 RETRY_BACKOFF초부터 두 배씩 늘어나며 무작위 편차를 둡니다.
+        서버가 Retry-After를 보낸 경우에는 공용 제한기가 그 시간만큼 추가로 기다립니다.
+        """
+        for attempt in range(FETCH_RETRIES + 1):
             try:
-                parsed_date = datetime.strptime(date_str, fmt)
-                # 2자리 연도를 4자리로 변환
-                if parsed_date.year < 2000:
-                    parsed_date = parsed_date.replace(year=parsed_date.year + 2000)
-                return parsed_date
-            except ValueError:
-                continue
-        
-        return None
+                if cache:
+                    return cache.fetch(self.session, url, timeout=15)
+                response = self.session.get(url, timeout=15)
+                response.raise_for_status()
+                return response.content
+            except requests.RequestException as e:
+                if attempt >= FETCH_RETRIES or not _is_transient_error(e):
+                    raise
+                delay = RETRY_BACKOFF * (2 ** attempt) * random.uniform(0.5, 1.5)
+                logger.info(f"일시적 오류로 {delay:.1f}초 후 재시도 ({attempt + 1}/{FETCH_RETRIES}): {e}")
+                time.sleep(delay)
     
-    def _get_page_with_requests(self, url: str) -> Optional[BeautifulSoup]:
-        """requests를 사용하여 페이지 가져오기 (빠른 방법)"""
+    def _get_page_with_requests(self, url: str) -> Optional[bytes]:
+        """requests를 사용하여 페이지 HTML 가져오기 (빠른 방법, 실패하면 None)"""
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+            return self._fetch_with_retry(url, self.http_cache)
         except Exception as e:
             logger.warning(f"requests로 페이지 가져오기 실패: {e}")
             return None
     
-    def _extract_contest_info_new_structure(self, item) -> Optional[Dict]:
+    def _get_page_with_selenium(self, url: str) -> Optional[str]:
+        """Selenium으로 페이지 HTML 가져오기 (requests로 실패한 페이지의 백업 방법, 실패하면 None)"""
+        try:
+            with self._get_driver_pool().lease() as pooled:
+                with self.rate_limiter.track():
+                    pooled.get(url)
+                
+                if not self._wait_for_page_load(pooled.driver):
+                    logger.warning(f"브라우저 페이지 로딩 실패: {url}")
+                    return None
+                return pooled.driver.page_source
+        except Exception as e:
+            logger.error(f"Selenium 크롤링 중 오류: {e}")
+            return None
+    
+    def _make_soup(self, markup) -> BeautifulSoup:
+        """설정된 파서로 HTML 파싱"""
+        return BeautifulSoup(markup, self.parser)
+    
+    def _extract_contest_info_new_structure(self, item) -> Optional[Contest]:
         """새로운 HTML 구조에 맞는 정보 추출"""
         try:
             # 다양한 제목 선택자 시도
@@ -245,13 +312,10 @@ class WevityCrawler:
                     # 링크 찾기
                     link_element = item.select_one("a[href]")
                     if link_element:
-                        return {
-                            "제목": title_text[:100],  # 제목 길이 제한
-                            "주최": "주최자 정보 없음",
-                            "기간": "기간 정보 없음",
-                            "마감일": None,
-                            "링크": urljoin(self.base_url, link_element.get('href', ''))
-                        }
+                        return Contest(
+                            title=title_text[:100],  # 제목 길이 제한
+                            link=urljoin(self.base_url, link_element.get('href', '')),
+                        )
                 return None
             
             title = title_element.get_text(strip=True)
@@ -265,7 +329,7 @@ class WevityCrawler:
             
             # 주최자 정보 추출
             host_selectors = [".organ", ".host", ".organizer", ".company"]
-            host = "주최자 정보 없음"
+            host = NO_HOST_TEXT
             
             for selector in host_selectors:
                 host_element = item.select_one(selector)
@@ -275,12 +339,10 @@ class WevityCrawler:
             
             # 기간 정보 추출 - 더 많은 선택자 시도
             period_selectors = [".day", ".period", ".date", ".deadline", ".time", ".dday"]
-            period = "기간 정보 없음"
+            period = NO_PERIOD_TEXT
             deadline = None
             
-            # 전체 텍스트에서도 날짜 찾기
             full_text = item.get_text(strip=True)
-            deadline = self._extract_deadline(full_text)
             
             for selector in period_selectors:
                 period_element = item.select_one(selector)
@@ -288,12 +350,14 @@ class WevityCrawler:
                     period_text = period_element.get_text(strip=True)
                     if period_text:
                         period = period_text
-                        # 더 정확한 마감일 추출 시도
-                        extracted_deadline = self._extract_deadline(period_text)
-                        if extracted_deadline:
-                            deadline = extracted_deadline
+                        # 기간 요소에서 먼저 마감일 추출 (더 정확함)
+                        deadline = self._extract_deadline(period_text)
                         break
             
+            # 기간 요소에서 찾지 못한 경우 전체 텍스트에서 날짜 찾기
+            if not deadline:
+                deadline = self._extract_deadline(full_text)
+            
             # 디버깅 로그 추가
             if deadline:
                 logger.debug(f"추출된 마감일: {deadline.date()} - {title[:50]}")
@@ -301,7 +365,7 @@ class WevityCrawler:
                 logger.debug(f"마감일 없음: {title[:50]} - 기간: {period}")
             
             # 상금 정보 추출 - 1등 상금 우선
-            prize = "상금 정보 없음"
+            prize = NO_PRIZE_TEXT
             
             # 1. 특정 위치의 1등 상금 찾기 (XPath 기반)
             # li[7]/span 위치의 상금 정보 (1등 상금)
@@ -313,7 +377,7 @@ class WevityCrawler:
                     prize = f"1등: {prize_text}"
             
             # 2. 일반적인 상금 선택자들
-            if prize == "상금 정보 없음":
+            if prize == NO_PRIZE_TEXT:
                 prize_selectors = [".prize", ".reward", ".money", ".won", ".award"]
                 for selector in prize_selectors:
                     prize_element = item.select_one(selector)
@@ -323,220 +387,493 @@ class WevityCrawler:
                             prize = prize_text
                             break
             
-            # 3. 전체 텍스트에서 1등 상금 패턴 찾기
-            if prize == "상금 정보 없음":
-                first_prize_patterns = [
-                    r'1등\s*:?\s*(\d+(?:,\d+)*(?:만|억)?원?)',
-                    r'대상\s*:?\s*(\d+(?:,\d+)*(?:만|억)?원?)',
-                    r'최우수상\s*:?\s*(\d+(?:,\d+)*(?:만|억)?원?)',
-                    r'금상\s*:?\s*(\d+(?:,\d+)*(?:만|억)?원?)',
-                ]
-                
-                for pattern in first_prize_patterns:
-                    match = re.search(pattern, full_text)
-                    if match:
-                        prize = f"1등: {match.group(1)}"
-                        break
+            # 3. 전체 텍스트에서 상금 패턴 찾기 (1등 상금 우선)
+            if prize == NO_PRIZE_TEXT:
+                prize = find_prize_text(full_text) or NO_PRIZE_TEXT
             
-            # 4. 일반적인 상금 패턴 찾기
-            if prize == "상금 정보 없음":
-                general_prize_patterns = [
-                    r'상금\s*:?\s*(\d+(?:,\d+)*(?:만|억)?원?)',
-                    r'총\s*상금\s*(\d+(?:,\d+)*(?:만|억)?원?)',
-                    r'(\d+(?:,\d+)*)\s*만원',
-                    r'(\d+(?:,\d+)*)\s*억원',
-                ]
-                
-                for pattern in general_prize_patterns:
-                    match = re.search(pattern, full_text)
-                    if match:
-                        prize = match.group(0)
-                        break
-            
-            return {
-                "제목": title,
-                "주최": host,
-                "기간": period,
-                "마감일": deadline.date() if deadline else None,
-                "상금": prize,
-                "링크": url
-            }
+            return Contest(
+                title=title,
+                link=url,
+                host=host,
+                period=period,
+                deadline=deadline.date() if deadline else None,
+                prize=prize,
+            )
             
         except Exception as e:
             logger.debug(f"공모전 정보 추출 실패: {e}")
             return None
     
-    def _wait_for_page_load(self):
-        """페이지 로딩 완료 대기"""
+    def _wait_for_page_load(self, driver):
+        """목록 요소가 나타날 때까지 대기 (고정 대기 없음)
+
+        이미지 등을 차단하면 문서 로딩은 거의 바로 끝나므로 목록 선택자만 기다리고,
+        PAGE_READY_GRACE초가 지나도 목록이 없으면 문서 로딩 완료를 준비된 것으로 봅니다.
+        """
+        selector = _item_wait_selector()
+        grace_until = time.monotonic() + PAGE_READY_GRACE
+
+        def page_ready(driver):
+            if driver.execute_script(PAGE_READY_SCRIPT, selector):
+                return True
+            return time.monotonic() >= grace_until and driver.execute_script(PAGE_LOADED_SCRIPT)
+
         try:
-            # JavaScript 실행 완료 대기
-            WebDriverWait(self.driver, 10).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
-            )
-            
-            # 추가 대기 (동적 콘텐츠 로딩)
-            time.sleep(2)
-            
-            # 공모전 목록이 있는지 확인
-            selectors_to_check = [
-                "ul.list", ".list", ".contest_list", 
-                "[class*='list']", "[class*='item']"
-            ]
-            
-            for selector in selectors_to_check:
-                try:
-                    WebDriverWait(self.driver, 5).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    return True
-                except:
-                    continue
-            
+            WebDriverWait(driver, PAGE_READY_TIMEOUT, poll_frequency=PAGE_READY_POLL).until(page_ready)
+            return True
+        except TimeoutException:
+            logger.warning(f"페이지 준비 대기 시간 초과 ({PAGE_READY_TIMEOUT}초)")
             return False
-            
         except Exception as e:
             logger.warning(f"페이지 로딩 대기 중 오류: {e}")
             return False
     
-    def crawl(self, keyword="공공데이터", max_pages=5, from_date=None, to_date=None) -> pd.DataFrame:
-        """공모전 정보 크롤링 - 개선된 버전"""
+    def crawl(self, keyword="공공데이터", max_pages=5, from_date=None, to_date=None, incremental=False,
+              enrich=False, detail_workers=None) -> pd.DataFrame:
+        """공모전 정보 크롤링 - 개선된 버전
         
-        # 먼저 requests로 시도
-        logger.info("requests를 사용하여 크롤링을 시도합니다...")
-        df_requests = self._crawl_with_requests(keyword, max_pages, from_date, to_date)
+        incremental=True이면 지난 실행 이후 새로 등록되었거나 내용이 바뀐 공모전만 반환하고,
+        이미 알고 있는 링크만 있는 페이지에서 수집을 멈춥니다.
+        enrich=True이면 주최/기간/상금 정보가 없는 공모전의 상세 페이지를 읽어 채웁니다
+        (detail_workers개 스레드, 기본은 크롤러의 detail_workers).
+        """
+        results = list(self.iter_contests(keyword, max_pages, from_date, to_date, incremental))
         
-        if not df_requests.empty:
-            logger.info(f"requests로 {len(df_requests)}개 공모전을 수집했습니다.")
-            return df_requests
+        if enrich and results:
+            results = self.enrich_contests(results, detail_workers)
+            if self.apply_filter:
+                # 상세 페이지에서 찾은 마감일로 다시 필터링
+                results = [contest_info for contest_info in results if self._filter_by_date(contest_info, from_date, to_date)]
         
-        # requests 실패 시 Selenium 사용
-        logger.info("Selenium을 사용하여 크롤링을 시도합니다...")
-        return self._crawl_with_selenium(keyword, max_pages, from_date, to_date)
+        logger.info(f"총 {len(results)}개 공모전을 수집했습니다.")
+        return build_contest_frame(results)
     
-    def _crawl_with_requests(self, keyword, max_pages, from_date, to_date) -> pd.DataFrame:
-        """requests를 사용한 크롤링 (빠른 방법)"""
-        results = []
-        seen_urls = set()
+    def enrich_contests(self, contests: List[Contest], max_workers=None) -> List[Contest]:
+        """상세 페이지로 빠진 주최/기간/상금 정보 채우기
+        
+        정보가 빠진 공모전만 max_workers개(기본 self.detail_workers)의 스레드로 동시에 가져오되, 요청 속도는 공용 제한기를 따릅니다.
+        상세 페이지는 정규화한 공모전 링크(검색어 sw=, 페이지 gp= 제외)별로 캐시되어 검색어가 달라도 한 번만 요청합니다.
+        """
+        targets = [
+            contest_info for contest_info in contests
+            if contest_info.host == NO_HOST_TEXT
+            or contest_info.period == NO_PERIOD_TEXT
+            or contest_info.prize == NO_PRIZE_TEXT
+        ]
+        if not targets:
+            return contests
+        
+        links = list(dict.fromkeys(normalize_contest_link(contest_info.link) for contest_info in targets))
+        
+        workers = self.detail_workers if max_workers is None else max(1, max_workers)
+        with ThreadPoolExecutor(max_workers=min(workers, len(links))) as executor:
+            details = dict(zip(links, executor.map(self._get_detail_fields, links)))
+        
+        enriched = []
+        filled = 0
+        for contest_info in contests:
+            fields = details.get(normalize_contest_link(contest_info.link))
+            if fields:
+                merged = self._merge_detail_fields(contest_info, fields)
+                if merged is not contest_info:
+                    filled += 1
+                contest_info = merged
+            enriched.append(contest_info)
         
+        logger.info(f"상세 페이지 {len(links)}개 확인, {filled}개 공모전 정보 보강")
+        return enriched
+    
+    def _merge_detail_fields(self, contest_info: Contest, fields) -> Contest:
+        """빠진 필드만 상세 페이지 값으로 채운 새 레코드 반환"""
+        changes = {}
+        if contest_info.host == NO_HOST_TEXT and fields.get('주최'):
+            changes['host'] = fields['주최']
+        if contest_info.period == NO_PERIOD_TEXT and fields.get('기간'):
+            changes['period'] = fields['기간']
+            if not contest_info.deadline:
+                deadline = self._extract_deadline(fields['기간'])
+                changes['deadline'] = deadline.date() if deadline else None
+        if contest_info.prize == NO_PRIZE_TEXT and fields.get('상금'):
+            changes['prize'] = fields['상금']
+        return replace(contest_info, **changes) if changes else contest_info
+    
+    def _get_detail_fields(self, link) -> Dict[str, str]:
+        """상세 페이지 필드 조회 (메모리 → 디스크 캐시 → 네트워크 순서)
+        
+        검색 위치에 따라 바뀌는 파라미터를 뺀 공모전 링크로 캐시하고 요청합니다.
+        """
+        key = link = normalize_contest_link(link)
+        with _detail_fields_lock:
+            fields = _detail_fields.pop(key, None)
+            if fields is not None:
+                _detail_fields[key] = fields  # 최근 사용으로 이동
+                return fields
+        
+        cache = self.detail_cache or get_default_detail_cache()
         try:
-            for page in range(1, max_pages + 1):
-                url = f"https://www.wevity.com/?c=find&s=1&gp={page}&sp=contents&sw={keyword}"
-                
-                soup = self._get_page_with_requests(url)
-                if not soup:
-                    continue
-                
-                # 공모전 목록 찾기
-                items = self._find_contest_items(soup)
-                
-                if not items:
-                    logger.warning(f"페이지 {page}: 공모전 목록을 찾을 수 없습니다.")
-                    continue
-                
-                page_count = 0
-                for item in items:
-                    contest_info = self._extract_contest_info_new_structure(item)
-                    
-                    if not contest_info or contest_info['링크'] in seen_urls:
-                        continue
-                    
-                    seen_urls.add(contest_info['링크'])
-                    
-                    # 날짜 필터링
-                    if self._filter_by_date(contest_info, from_date, to_date):
-                        results.append(contest_info)
-                        page_count += 1
-                
-                logger.info(f"페이지 {page}: {page_count}개 공모전 수집")
-                
-                if page_count == 0 and page > 1:
-                    break
-                    
-                time.sleep(1)  # 요청 간격
-                
+            content = self._fetch_with_retry(link, cache)
+            fields = self._parse_detail_page(self._make_soup(content))
         except Exception as e:
-            logger.error(f"requests 크롤링 중 오류: {e}")
+            logger.warning(f"상세 페이지 가져오기 실패: {link} - {e}")
+            return {}
         
-        return pd.DataFrame(results)
+        with _detail_fields_lock:
+            _detail_fields.pop(key, None)
+            _detail_fields[key] = fields
+            while len(_detail_fields) > _DETAIL_FIELDS_CACHE_SIZE:
+                _detail_fields.pop(next(iter(_detail_fields)))
+        return fields
     
-    def _crawl_with_selenium(self, keyword, max_pages, from_date, to_date) -> pd.DataFrame:
-        """Selenium을 사용한 크롤링 (백업 방법)"""
-        if not self._setup_driver():
-            return pd.DataFrame()
+    def _parse_detail_page(self, soup) -> Dict[str, str]:
+        """상세 페이지의 '항목명: 값' 목록에서 주최/기간/상금 추출"""
+        rows = []
+        for selector in DETAIL_ROW_SELECTORS:
+            rows = soup.select(selector)
+            if rows:
+                break
         
-        results = []
+        fields = {}
+        for label, value in self._detail_label_values(rows):
+            if not value:
+                continue
+            
+            if '주최' in label:
+                fields.setdefault('주최', value)
+            elif '기간' in label:
+                fields.setdefault('기간', value)
+            elif '상금' in label and any(char in value for char in PRIZE_CHARS):
+                if '1등' in label:
+                    fields['상금'] = f"1등: {value}"
+                else:
+                    fields.setdefault('상금', value)
+        return fields
+    
+    @staticmethod
+    def _detail_label_values(rows) -> Iterator[Tuple[str, str]]:
+        """상세 정보 행에서 (항목명, 값) 쌍 추출 (dl은 각 dt와 뒤따르는 dd를 한 쌍으로 봄)"""
+        for row in rows:
+            if row.name == 'dl':
+                for term in row.find_all('dt'):
+                    description = term.find_next_sibling(('dt', 'dd'))
+                    if description is not None and description.name == 'dd':
+                        yield term.get_text(strip=True), description.get_text(' ', strip=True)
+                continue
+            
+            label_element = row.select_one('.tit, dt, strong')
+            if not label_element:
+                continue
+            label = label_element.get_text(strip=True)
+            label_element.extract()
+            yield label, row.get_text(' ', strip=True)
+    
+    def iter_contests(self, keyword="공공데이터", max_pages=5, from_date=None, to_date=None,
+                      incremental=False) -> Iterator[Contest]:
+        """필터를 통과한 공모전을 페이지가 파싱되는 대로 하나씩 반환"""
+        for contests in self.iter_pages(keyword, max_pages, from_date, to_date, incremental):
+            yield from contests
+    
+    def iter_pages(self, keyword="공공데이터", max_pages=5, from_date=None, to_date=None,
+                   incremental=False) -> Iterator[List[Contest]]:
+        """페이지 단위로 수집된 공모전 목록 반환 (동기 제너레이터)"""
+        return _iterate_async(self.aiter_pages(keyword, max_pages, from_date, to_date, incremental))
+    
+    async def aiter_contests(self, keyword="공공데이터", max_pages=5, from_date=None, to_date=None,
+                             incremental=False) -> AsyncIterator[Contest]:
+        """iter_contests의 비동기 버전"""
+        async for contests in self.aiter_pages(keyword, max_pages, from_date, to_date, incremental):
+            for contest_info in contests:
+                yield contest_info
+    
+    async def aiter_pages(self, keyword="공공데이터", max_pages=5, from_date=None, to_date=None,
+                          incremental=False) -> AsyncIterator[List[Contest]]:
+        """페이지 단위 비동기 제너레이터
+        
+        requests로 수집하고, 재시도 후에도 가져오지 못한 페이지만 Selenium으로 다시 시도합니다.
+        한 페이지도 가져오지 못하면 CrawlFetchError를 발생시킵니다 (검색 결과 없음은 오류가 아님).
+        증분 모드에서는 끝까지 수집한 경우에만 워터마크를 갱신하므로, 중간에 멈춘
+        소비자는 다음 실행에서 같은 공모전을 다시 받게 됩니다.
+        """
+        self.today = datetime.now().date()
+        watermark_key = self._watermark_key(keyword, from_date, to_date)
+        known = self.watermark.load(watermark_key) if incremental else None
+        observed = {}
+        
+        async for _, contests in self._aiter_requests_pages(keyword, max_pages, from_date, to_date,
+                                                            known=known, observed=observed,
+                                                            parse_pool=self._get_parse_pool(max_pages)):
+            if contests:
+                yield contests
+        
+        if incremental and observed:
+            self.watermark.update(watermark_key, observed)
+    
+    def _watermark_key(self, keyword, from_date=None, to_date=None) -> str:
+        """워터마크 키 (날짜 필터를 적용하면 기간도 포함)
+        
+        워터마크에는 날짜 필터에 걸러진 공모전도 기록되므로, 기간이 다른 실행은 별도 워터마크를 써야
+        넓힌 기간에 새로 들어오는 공모전을 놓치지 않습니다.
+        """
+        keyword = keyword.strip()
+        if not self.apply_filter or (not from_date and not to_date):
+            return keyword
+        return f"{keyword}|{from_date or ''}~{to_date or ''}"
+    
+    def _build_search_url(self, keyword, page) -> str:
+        """검색 결과 목록 페이지 URL 생성"""
+        return f"{self.base_url}/?c=find&s=1&gp={page}&sp=contents&sw={keyword}"
+    
+    def _parse_contest_page(self, soup, page) -> Optional[List[Contest]]:
+        """목록 페이지에서 공모전 정보 추출 (목록이 없으면 None)"""
+        items = self._find_contest_items(soup)
+        
+        if not items:
+            logger.warning(f"페이지 {page}: 공모전 목록을 찾을 수 없습니다.")
+            return None
+        
+        contests = []
+        for item in items:
+            contest_info = self._extract_contest_info_new_structure(item)
+            if contest_info:
+                contests.append(contest_info)
+        return contests
+    
+    def _parse_contest_markup(self, markup, page) -> Optional[List[Contest]]:
+        """목록 페이지 HTML 파싱 (목록이 없으면 None)"""
+        return self._parse_contest_page(self._make_soup(markup), page)
+    
+    def _get_parse_pool(self, pages) -> Optional[ProcessPoolExecutor]:
+        """pages개 페이지를 파싱할 프로세스 풀 (작업이 작거나 parse_workers가 1 이하면 None)"""
+        if self.parse_workers <= 1 or pages < PARSE_POOL_MIN_PAGES:
+            return None
+        return get_parse_pool(self.parse_workers)
+    
+    async def _aparse_contest_markup(self, markup, page, parse_pool=None) -> Optional[List[Contest]]:
+        """목록 페이지 HTML을 파싱 프로세스 풀(없으면 현재 프로세스의 스레드)에서 파싱
+        
+        풀에는 HTML 바이트만 보내고 공모전은 튜플로 돌려받습니다. 풀에 문제가 생기면 현재 프로세스에서 파싱합니다.
+        """
+        loop = asyncio.get_running_loop()
+        if parse_pool is not None:
+            try:
+                rows, learned = await loop.run_in_executor(parse_pool, _parse_listing_in_worker, markup, page,
+                                                           self.base_url, self.parser, self._today())
+            except Exception as e:
+                logger.warning(f"페이지 {page}: 파싱 프로세스 오류로 현재 프로세스에서 파싱합니다 - {e}")
+            else:
+                for fingerprint, selector in learned:
+                    _remember_selector(fingerprint, selector)
+                return None if rows is None else [Contest(*row) for row in rows]
+        return await loop.run_in_executor(None, self._parse_contest_markup, markup, page)
+    
+    def _apply_watermark(self, contests, known, observed) -> Tuple[List[Contest], bool]:
+        """이미 알고 있는 공모전 제외
+        
+        (새로 등록되었거나 내용이 바뀐 공모전, 페이지의 모든 링크가 이미 알려진 것인지)를 반환하고
+        확인한 모든 링크의 지문을 observed에 기록합니다. 링크는 페이지 번호(gp=)·검색어(sw=)를 뺀
+        공모전 링크로 비교하므로, 새 공모전에 밀려 다음 페이지로 넘어간 공모전도 아는 것으로 봅니다.
+        """
+        changed = []
+        all_known = bool(contests)
+        for contest_info in contests:
+            fingerprint = contest_fingerprint(contest_info)
+            link_key = normalize_contest_link(contest_info.link)
+            observed[link_key] = fingerprint
+            
+            previous = known.get(link_key)
+            if previous is None:
+                all_known = False
+            if previous != fingerprint:
+                changed.append(contest_info)
+        return changed, all_known
+    
+    def _accept_page(self, page, contests, seen_urls, from_date, to_date) -> List[Contest]:
+        """중복 제거 및 날짜 필터링을 통과한 공모전 반환
+        
+        캐시에서 서로 다른 시점의 페이지를 받으면 같은 공모전이 gp=만 다른 링크로 두 페이지에 나올 수 있어
+        정규화한 공모전 링크로 중복을 판단합니다.
+        """
+        accepted = []
+        for contest_info in contests:
+            link_key = normalize_contest_link(contest_info.link)
+            if link_key in seen_urls:
+                continue
+            
+            seen_urls.add(link_key)
+            
+            # 날짜 필터링
+            if not self.apply_filter or self._filter_by_date(contest_info, from_date, to_date):
+                accepted.append(contest_info)
+        
+        logger.info(f"페이지 {page}: {len(accepted)}개 공모전 수집")
+        return accepted
+    
+    async def _aiter_requests_pages(self, keyword, max_pages, from_date, to_date, semaphore=None,
+                                    known=None, observed=None,
+                                    parse_pool=None) -> AsyncIterator[Tuple[int, List[Contest]]]:
+        """asyncio 기반 동시 페이지 수집 (requests, 실패한 페이지만 Selenium)
+        
+        최대 max_concurrency개의 페이지를 동시에 가져오고, 도착하는 대로 파싱합니다.
+        재시도 후에도 가져오지 못한 페이지는 해당 페이지만 브라우저로 다시 가져오며,
+        그래도 실패한 페이지는 건너뜁니다. 한 페이지도 가져오지 못하면 CrawlFetchError를 발생시킵니다.
+        중복 제거와 '빈 페이지에서 중단' 규칙은 페이지 순서대로 적용하여
+        (페이지 번호, 수집된 공모전 목록)을 순서대로 반환합니다.
+        여러 키워드를 함께 수집할 때는 semaphore를 공유하여 전체 동시 요청 수를 제한합니다.
+        parse_pool이 주어지면 HTML 파싱을 그 프로세스 풀에서 수행합니다.
+        
+        known이 주어지면 (증분 모드) 첫 페이지를 먼저 확인한 뒤 나머지 페이지를 요청하고,
+        모든 링크가 이미 알려진 페이지에서 수집을 멈춥니다.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = semaphore or asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch_and_parse(page):
+            url = self._build_search_url(keyword, page)
+            async with semaphore:
+                markup = await loop.run_in_executor(None, self._get_page_with_requests, url)
+            if markup is None:
+                logger.info(f"페이지 {page}: Selenium으로 다시 시도합니다...")
+                markup = await loop.run_in_executor(None, self._get_page_with_selenium, url)
+            if markup is None:
+                return page, None, False
+            return page, await self._aparse_contest_markup(markup, page, parse_pool), True
+        
+        tasks = []
+        
+        def launch_until(last_page):
+            new_tasks = set()
+            for page in range(len(tasks) + 1, min(last_page, max_pages) + 1):
+                task = asyncio.ensure_future(fetch_and_parse(page))
+                tasks.append(task)
+                new_tasks.add(task)
+            return new_tasks
+        
+        pending = launch_until(1 if known is not None else max_pages)
         seen_urls = set()
+        parsed_pages = {}
+        next_page = 1
+        failed_pages = []
         
         try:
-            for page in range(1, max_pages + 1):
-                url = f"https://www.wevity.com/?c=find&s=1&gp={page}&sp=contents&sw={keyword}"
-                logger.info(f"페이지 {page} 크롤링 중: {url}")
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page, contests, fetched = task.result()
+                    parsed_pages[page] = contests
+                    if not fetched:
+                        failed_pages.append(page)
                 
-                self.driver.get(url)
-                
-                if not self._wait_for_page_load():
-                    logger.warning(f"페이지 {page} 로딩 실패")
-                    continue
-                
-                soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                items = self._find_contest_items(soup)
-                
-                if not items:
-                    logger.warning(f"페이지 {page}: 공모전 목록을 찾을 수 없습니다.")
-                    continue
-                
-                page_count = 0
-                for item in items:
-                    contest_info = self._extract_contest_info_new_structure(item)
+                # 앞 페이지가 모두 도착한 경우에만 순서대로 반영
+                while next_page in parsed_pages:
+                    contests = parsed_pages.pop(next_page)
+                    current_page = next_page
+                    next_page += 1
                     
-                    if not contest_info or contest_info['링크'] in seen_urls:
-                        continue
+                    all_known = False
+                    if contests is not None and known is not None:
+                        contests, all_known = self._apply_watermark(contests, known, observed)
                     
-                    seen_urls.add(contest_info['링크'])
+                    if contests is not None:
+                        accepted = self._accept_page(current_page, contests, seen_urls, from_date, to_date)
+                        yield current_page, accepted
+                        
+                        if all_known:
+                            logger.info(f"페이지 {current_page}: 새 공모전이 없어 수집을 멈춥니다.")
+                            return
+                        if not accepted and current_page > 1:
+                            return
                     
-                    if self._filter_by_date(contest_info, from_date, to_date):
-                        results.append(contest_info)
-                        page_count += 1
-                
-                logger.info(f"페이지 {page}: {page_count}개 공모전 수집")
-                
-                if page_count == 0 and page > 1:
-                    break
-                    
-        except Exception as e:
-            logger.error(f"Selenium 크롤링 중 오류: {e}")
+                    # 증분 모드: 첫 페이지 확인 후 나머지 페이지 요청
+                    pending |= launch_until(max_pages)
+            
+            if failed_pages and len(failed_pages) == len(tasks):
+                raise CrawlFetchError(f"'{keyword}' 검색 결과 페이지를 가져오지 못했습니다.")
+            if failed_pages:
+                logger.warning(f"'{keyword}' 페이지 {sorted(failed_pages)}를 가져오지 못해 건너뛰었습니다.")
         finally:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def crawl_many(self, keywords, max_pages=5, from_date=None, to_date=None) -> pd.DataFrame:
+        """여러 키워드 일괄 크롤링
+        
+        하나의 세션으로 모든 키워드의 페이지를 동시에 가져오고, 정규화한 공모전 링크(검색어 sw=, 페이지 gp= 제외)
+        기준으로 키워드 간 중복을 제거합니다. 각 공모전이 검색된 키워드는 matched_keywords 열에 기록됩니다.
+        """
+        self.today = datetime.now().date()
+        keywords = list(dict.fromkeys(kw.strip() for kw in keywords if kw and kw.strip()))
+        results_by_keyword = {kw: [] for kw in keywords}
         
-        return pd.DataFrame(results)
+        failed_keywords = _run_async(self._crawl_many_async(keywords, max_pages, from_date, to_date,
+                                                            results_by_keyword))
+        if keywords and len(failed_keywords) == len(keywords):
+            raise CrawlFetchError("모든 키워드의 검색 결과 페이지를 가져오지 못했습니다.")
+        
+        merged = {}
+        matched = {}
+        for kw in keywords:
+            for contest_info in results_by_keyword[kw]:
+                link_key = normalize_contest_link(contest_info.link)
+                merged.setdefault(link_key, contest_info)
+                matched.setdefault(link_key, []).append(kw)
+        
+        total = sum(len(results) for results in results_by_keyword.values())
+        logger.info(f"{len(keywords)}개 키워드에서 {total}건 수집, 중복 제거 후 {len(merged)}개 공모전")
+        df = build_contest_frame(merged.values(),
+                                 matched_keywords=[', '.join(matched[link_key]) for link_key in merged])
+        df.attrs['failed_keywords'] = failed_keywords  # 수집에 실패한 키워드 (결과 없음과 구분)
+        return df
+    
+    async def _crawl_many_async(self, keywords, max_pages, from_date, to_date, results_by_keyword) -> List[str]:
+        """모든 키워드의 페이지를 공유 semaphore로 동시에 수집, 실패한 키워드 목록 반환"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        parse_pool = self._get_parse_pool(len(keywords) * max_pages)
+        
+        async def collect(kw):
+            async for _, contests in self._aiter_requests_pages(kw, max_pages, from_date, to_date, semaphore,
+                                                                parse_pool=parse_pool):
+                results_by_keyword[kw].extend(contests)
+        
+        outcomes = await asyncio.gather(*(collect(kw) for kw in keywords), return_exceptions=True)
+        
+        failed_keywords = []
+        for kw, outcome in zip(keywords, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"'{kw}' 크롤링 중 오류: {outcome}")
+                failed_keywords.append(kw)
+        return failed_keywords
     
     def _find_contest_items(self, soup):
-        """공모전 아이템 찾기 - 다양한 선택자 시도"""
-        selectors = [
-            "ul.list li",
-            ".list li", 
-            ".contest_list li",
-            ".board_list tr",
-            "tr",
-            ".item",
-            "div[class*='item']",
-            "div[class*='contest']",
-            "li[class*='list']"
-        ]
+        """공모전 아이템 찾기 - 다양한 선택자 시도
         
-        for selector in selectors:
-            items = soup.select(selector)
-            # 유효한 아이템 수 체크 (헤더 제외)
-            valid_items = [item for item in items if self._is_valid_contest_item(item)]
+        같은 페이지 구조(DOM 지문)에서 성공했던 선택자를 먼저 시도하고,
+        실패하거나 구조가 바뀐 경우에만 전체 선택자를 순서대로 확인합니다.
+        """
+        fingerprint = _dom_fingerprint(soup)
+        learned = _selector_cache.get(fingerprint)
+        
+        if learned:
+            valid_items = self._select_valid_items(soup, learned)
+            if valid_items:
+                logger.debug(f"학습된 선택자 '{learned}': {len(valid_items)}개 유효한 아이템 발견")
+                return valid_items
+        
+        for selector in CONTEST_ITEM_SELECTORS:
+            if selector == learned:
+                continue
             
-            if len(valid_items) > 0:
+            valid_items = self._select_valid_items(soup, selector)
+            if valid_items:
                 logger.info(f"선택자 '{selector}': {len(valid_items)}개 유효한 아이템 발견")
+                _remember_selector(fingerprint, selector)
                 return valid_items
         
         return []
     
+    def _select_valid_items(self, soup, selector):
+        """선택자로 찾은 요소 중 유효한 아이템만 반환 (헤더 제외)"""
+        return [item for item in soup.select(selector) if self._is_valid_contest_item(item)]
+    
     def _is_valid_contest_item(self, item):
         """유효한 공모전 아이템인지 확인"""
         text = item.get_text(strip=True)
@@ -558,20 +895,13 @@ class WevityCrawler:
     
     def _filter_by_date(self, contest_info, from_date, to_date):
         """날짜 필터링 및 불필요한 공모전 제외"""
-        deadline = contest_info['마감일']
-        today = datetime.now().date()
-        title = contest_info['제목'][:50]
-        full_title = contest_info['제목'].lower()
+        deadline = contest_info.deadline
+        today = self._today()
+        title = contest_info.title[:50]
+        full_title = contest_info.title.lower()
         
         # 1. 불필요한 키워드가 포함된 공모전 제외
-        exclude_keywords = [
-            '모집', '채용', '무료', '멘토링', 'special', '스페셜',
-            '교육', '강의', '세미나', '워크샵', '설명회', '상담',
-            '지원자', '참가자', '수강생', '인턴', '아르바이트',
-            '봉사', '자원봉사', '기부', '후원', '협찬'
-        ]
-        
-        for keyword in exclude_keywords:
+        for keyword in EXCLUDE_TITLE_KEYWORDS:
             if keyword in full_title:
                 logger.debug(f"제외 키워드 '{keyword}'로 인해 제외: {title}")
                 return False
@@ -594,30 +924,201 @@ class WevityCrawler:
             logger.debug(f"날짜 필터 통과: {deadline} - {title}")
         else:
             # 마감일이 없는 경우 - 기간 텍스트에서 "마감" 키워드 체크
-            period_text = contest_info.get('기간', '').lower()
-            if any(keyword in period_text for keyword in ['마감', '종료', '완료']):
+            period_text = contest_info.period.lower()
+            if any(keyword in period_text for keyword in CLOSED_PERIOD_KEYWORDS):
                 logger.debug(f"마감 키워드로 제외: {period_text} - {title}")
                 return False
             
             logger.debug(f"마감일 없음으로 포함: {title}")
         
         return True
+
+# 파싱 프로세스 풀 (워커 수별, 프로세스 공용)
+_parse_pools: Dict[int, ProcessPoolExecutor] = {}
+_parse_pools_lock = threading.Lock()
+
+def get_parse_pool(workers=PARSE_WORKERS) -> ProcessPoolExecutor:
+    """목록 페이지 파싱용 프로세스 풀 (처음 요청할 때 생성해 재사용)
     
-    def __del__(self):
-        """소멸자"""
-        if self.driver:
-            self.driver.quit()
+    대시보드처럼 스레드가 많은 프로세스에서도 안전하도록 spawn 방식으로 워커를 시작합니다.
+    """
+    with _parse_pools_lock:
+        pool = _parse_pools.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _parse_pools[workers] = pool
+        return pool
+
+# 파싱 프로세스 안에서 재사용하는 크롤러 (base_url, parser별)
+_worker_crawlers: Dict[Tuple[str, str], 'WevityCrawler'] = {}
+
+def _parse_listing_in_worker(markup, page, base_url, parser, today):
+    """파싱 프로세스에서 목록 페이지 파싱
+    
+    (공모전 튜플 목록 또는 None, 이번에 새로 학습한 (DOM 지문, 선택자) 목록)을 반환합니다.
+    """
+    crawler = _worker_crawlers.get((base_url, parser))
+    if crawler is None:
+        crawler = WevityCrawler(parser=parser, parse_workers=1)
+        crawler.base_url = base_url
+        _worker_crawlers[(base_url, parser)] = crawler
+    crawler.today = today
+    
+    before = dict(_selector_cache)
+    contests = crawler._parse_contest_markup(markup, page)
+    learned = [(fingerprint, selector) for fingerprint, selector in _selector_cache.items()
+               if before.get(fingerprint) != selector]
+    rows = None if contests is None else [contest.to_tuple() for contest in contests]
+    return rows, learned
+
+def _run_async(coro):
+    """코루틴 실행 (이미 이벤트 루프가 돌고 있으면 별도 스레드에서 실행)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+def _iterate_async(agen):
+    """비동기 제너레이터를 동기 제너레이터로 변환
+    
+    전용 스레드의 이벤트 루프에서 한 항목씩 진행하므로, 호출 측에 이미
+    이벤트 루프가 실행 중이어도 사용할 수 있습니다.
+    """
+    loop = asyncio.new_event_loop()
+    executor = ThreadPoolExecutor(max_workers=1)
+    
+    def step(coro):
+        return executor.submit(loop.run_until_complete, coro).result()
+    
+    try:
+        while True:
+            try:
+                item = step(agen.__anext__())
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        try:
+            step(agen.aclose())
+            step(loop.shutdown_asyncgens())
+            step(loop.shutdown_default_executor())
+        finally:
+            loop.close()
+            executor.shutdown(wait=False)
+
+_default_http_cache = None
+
+def get_default_http_cache() -> HttpCache:
+    """프로세스 공용 HTTP 캐시 (WEVITY_CACHE_DIR, WEVITY_CACHE_TTL 환경변수로 설정)"""
+    global _default_http_cache
+    if _default_http_cache is None:
+        _default_http_cache = HttpCache()
+    return _default_http_cache
+
+_default_detail_cache = None
+
+def get_default_detail_cache() -> HttpCache:
+    """상세 페이지용 프로세스 공용 캐시 (WEVITY_DETAIL_CACHE_TTL, 기본 하루)"""
+    global _default_detail_cache
+    if _default_detail_cache is None:
+        _default_detail_cache = HttpCache(ttl=int(os.getenv('WEVITY_DETAIL_CACHE_TTL', '86400')))
+    return _default_detail_cache
 
 # 편의 함수
-def crawl_wevity(keyword="공공데이터", max_pages=5, from_date=None, to_date=None) -> pd.DataFrame:
-    """Wevity 공모전 크롤링 편의 함수"""
-    crawler = WevityCrawler()
+def _save_to_store(store, df, keywords, max_pages):
+    """크롤링 결과를 저장소에 반영 (저장 실패는 크롤링 결과에 영향 없음)"""
+    try:
+        if len(keywords) == 1:
+            store.upsert(df, keywords[0])
+        else:
+            store.upsert(df)
+        for keyword in keywords:
+            if df.empty:
+                count = 0
+            elif 'matched_keywords' in df.columns:
+                count = int(df['matched_keywords'].str.split(', ').apply(lambda kws: keyword in kws).sum())
+            else:
+                count = len(df)
+            store.record_crawl(keyword, max_pages, count)
+    except Exception as e:
+        logger.warning(f"저장소 기록 실패: {e}")
+
+def crawl_wevity(keyword="공공데이터", max_pages=5, from_date=None, to_date=None, use_cache=True,
+                 incremental=False, enrich=False, store=None, apply_filter=True, raise_errors=False,
+                 detail_workers=DETAIL_WORKERS) -> pd.DataFrame:
+    """Wevity 공모전 크롤링 편의 함수 (store를 주면 결과를 저장소에 반영)
+
+    apply_filter=False이면 날짜/키워드 필터링 없이 수집한 전체 결과를 반환합니다 (filter_contests로 나중에 적용).
+    enrich=True일 때 상세 페이지는 detail_workers개 스레드로 가져옵니다 (WEVITY_DETAIL_WORKERS, 기본 4).
+    기본적으로 실패하면 빈 DataFrame을 반환하고, raise_errors=True이면 예외(CrawlFetchError 등)를 그대로 전달합니다.
+    """
+    crawler = WevityCrawler(http_cache=get_default_http_cache() if use_cache else None, apply_filter=apply_filter,
+                            detail_workers=detail_workers)
     try:
-        return crawler.crawl(keyword, max_pages, from_date, to_date)
+        df = crawler.crawl(keyword, max_pages, from_date, to_date, incremental, enrich)
     except Exception as e:
         logger.error(f"크롤링 실패: {e}")
+        if raise_errors:
+            raise
         return pd.DataFrame()
 
+    if store is not None:
+        _save_to_store(store, df, [keyword.strip()], max_pages)
+    return df
+
+def crawl_many(keywords, max_pages=5, from_date=None, to_date=None, use_cache=True, store=None,
+               apply_filter=True) -> pd.DataFrame:
+    """여러 키워드 일괄 크롤링 편의 함수 (store를 주면 결과를 저장소에 반영)"""
+    crawler = WevityCrawler(http_cache=get_default_http_cache() if use_cache else None, apply_filter=apply_filter)
+    try:
+        df = crawler.crawl_many(keywords, max_pages, from_date, to_date)
+    except Exception as e:
+        logger.error(f"일괄 크롤링 실패: {e}")
+        return pd.DataFrame()
+
+    if store is not None:
+        # 수집에 실패한 키워드는 기록하지 않아 다음에 다시 수집되도록 함
+        failed_keywords = df.attrs.get('failed_keywords', [])
+        unique_keywords = list(dict.fromkeys(k.strip() for k in keywords if k and k.strip()))
+        _save_to_store(store, df, [k for k in unique_keywords if k not in failed_keywords], max_pages)
+    return df
+
+def _search_store(store, keyword, from_date, to_date) -> pd.DataFrame:
+    """저장소 전문 검색 결과와 해당 키워드로 수집된 공모전을 합쳐 필터링 후 반환
+
+    위비티 검색은 본문까지 찾으므로 제목/주최/기간에 키워드가 없는 공모전도 함께 포함합니다.
+    """
+    df = pd.concat([store.search(keyword, from_date, to_date), store.query(keyword, from_date, to_date)],
+                   ignore_index=True)
+    # 범주가 다른 범주형 열끼리 합치면 object가 되므로 dtype을 다시 맞춤
+    df = as_contest_frame(df.drop_duplicates(subset='링크'))
+    return filter_contests(df, from_date, to_date)
+
+def search_contests(keyword, max_pages=5, from_date=None, to_date=None, store=None,
+                    min_results=5, max_age=None, live_fallback=True) -> pd.DataFrame:
+    """저장소 전문 검색 우선 조회
+
+    로컬 색인에서 먼저 찾고, live_fallback이면 결과가 min_results개 미만이거나
+    키워드의 마지막 크롤링이 max_age초보다 오래된 경우에만 실제 크롤링 후 다시 조회합니다.
+    """
+    store = store or ContestStore()
+    keyword = keyword.strip()
+    from_date = from_date or datetime.now().date()  # 저장소에는 이미 마감된 공모전도 남아 있음
+    df = _search_store(store, keyword, from_date, to_date)
+
+    if not live_fallback:
+        return df
+    if len(df) >= min_results and not store.is_stale(keyword, DEFAULT_MAX_AGE if max_age is None else max_age):
+        logger.info(f"'{keyword}' 저장소 검색 결과 {len(df)}개 사용")
+        return df
+
+    logger.info(f"'{keyword}' 저장소 결과가 부족하거나 오래되어 실시간 크롤링합니다.")
+    crawl_wevity(keyword, max_pages, from_date, to_date, store=store, apply_filter=False)
+    return _search_store(store, keyword, from_date, to_date)
+
 # 테스트 함수
 def test_crawler():
     """크롤러 테스트"""
@@ -6,11 +6,23 @@ import calendar
 import base64
 import traceback
 import logging
-from wevity_crawler import crawl_wevity
+from functools import partial
+from typing import Optional, Tuple
+from wevity_crawler import crawl_wevity, search_contests
+from contest_store import ContestStore
+from contest_rules import filter_contests
+from contest_model import SortedContests, SORT_OPTIONS, prize_column
+from prefetch_scheduler import PrefetchScheduler, prefetch_keywords, format_data_age, PREFETCH_ENABLED
 from email_sender import send_email_streamlit
 import os
 import io
 
+# 크롤링 결과 캐시 유지 시간 (초)
+CRAWL_CACHE_TTL = int(os.getenv('WEVITY_DASHBOARD_CACHE_TTL', '600'))
+
+# 담기 목록이 바뀔 때 다시 그리는 fragment (목록 전체나 앱 전체는 다시 실행하지 않음)
+SELECTION_FRAGMENTS = ["selection_summary", "selection_actions"]
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -26,41 +38,102 @@ st.set_page_config(
 # 세션 상태 초기화
 def init_session_state():
     """세션 상태 안전하게 초기화"""
-    if 'search_results' not in st.session_state:
-        st.session_state['search_results'] = pd.DataFrame()
+    if 'raw_results' not in st.session_state:
+        st.session_state['raw_results'] = pd.DataFrame()  # 날짜/키워드 필터링 전 검색 결과
     if 'search_in_progress' not in st.session_state:
         st.session_state['search_in_progress'] = False
-    if 'selected_contests' not in st.session_state:
-        st.session_state['selected_contests'] = set()
-    if 'contest_data' not in st.session_state:
-        st.session_state['contest_data'] = {}
+    if 'selected_ids' not in st.session_state:
+        st.session_state['selected_ids'] = set()  # 담은 공모전 ID (contest_id 열)
+    if 'selection_archive' not in st.session_state:
+        st.session_state['selection_archive'] = pd.DataFrame()  # 이전 검색 결과에서 담은 공모전
     if 'current_page' not in st.session_state:
         st.session_state['current_page'] = 1
-    if 'selected_keyword' not in st.session_state:
-        st.session_state['selected_keyword'] = '공공데이터'
+    if 'search_keyword' not in st.session_state:
+        st.session_state['search_keyword'] = '공공데이터'
 
 # 세션 상태 초기화 실행
 init_session_state()
 
-def toggle_contest_selection(contest_key, contest):
+def selected_frame() -> pd.DataFrame:
+    """담은 공모전 DataFrame - 현재 검색 결과와 보관된 이전 결과에서 ID로 인덱싱"""
+    selected_ids = st.session_state['selected_ids']
+    frames = [
+        frame[frame['contest_id'].isin(selected_ids)]
+        for frame in (st.session_state['selection_archive'], st.session_state['raw_results'])
+        if not frame.empty
+    ]
+    if not frames:
+        return pd.DataFrame()
+    # 같은 공모전은 최근 검색 결과의 값을 사용
+    return pd.concat(frames, ignore_index=True).drop_duplicates(subset='contest_id', keep='last')
+
+def set_search_results(df):
+    """새 검색 결과 저장 (이전 결과에서 담은 공모전은 보관해 두어 발송/다운로드에 포함)"""
+    st.session_state['selection_archive'] = selected_frame()
+    st.session_state['raw_results'] = df
+    st.session_state['results_version'] = st.session_state.get('results_version', 0) + 1
+
+def toggle_contest_selection(contest_id):
     """체크박스 상태 변경 시 호출되는 콜백 함수"""
-    # 세션 상태 안전하게 가져오기
-    selected_contests = st.session_state.get('selected_contests', set())
-    contest_data = st.session_state.get('contest_data', {})
-    
-    if contest_key in selected_contests:
-        # 선택 해제
-        selected_contests.remove(contest_key)
-        if contest_key in contest_data:
-            del contest_data[contest_key]
+    if st.session_state[f"cb_{contest_id}"]:
+        st.session_state['selected_ids'].add(contest_id)
     else:
-        # 선택 추가
-        selected_contests.add(contest_key)
-        contest_data[contest_key] = contest.to_dict()
-    
-    # 세션 상태 업데이트
-    st.session_state['selected_contests'] = selected_contests
-    st.session_state['contest_data'] = contest_data
+        st.session_state['selected_ids'].discard(contest_id)
+    st.rerun(SELECTION_FRAGMENTS)
+
+def sync_grid_selection(grid_key, contest_ids):
+    """표 보기 선택 변경 콜백 - 표에서 새로 선택/해제한 행만 담기 목록에 반영
+    
+    표는 담은 공모전을 기본 선택(selection_default)으로 하여 그려지고, 표 밖에서 담은 공모전은
+    그대로 두도록 직전 표 선택과의 차이만 적용합니다.
+    """
+    selected_ids = st.session_state['selected_ids']
+    # contest_ids는 사용자가 클릭한 표의 데이터 - 그 표에 없는 행 위치는 무시
+    rows = [row for row in st.session_state[grid_key].selection.rows if 0 <= row < len(contest_ids)]
+    current = set(contest_ids[rows].tolist())
+    grid_selections = st.session_state.setdefault('grid_selected_ids', {})
+    previous = grid_selections.get(grid_key)
+    if previous is None:
+        previous = selected_ids.intersection(contest_ids.tolist())
+    
+    # 이 표에 있는 공모전만 바뀌므로 이전 검색에서 담은 공모전(보관 목록)은 그대로 유지
+    selected_ids -= previous - current
+    selected_ids |= current - previous
+    
+    grid_selections[grid_key] = current
+    st.rerun(SELECTION_FRAGMENTS)
+
+def _set_visible_checkboxes(value):
+    """화면에 있는 카드 체크박스 상태 맞추기 (다른 카드는 그릴 때 selected_ids를 따름)
+    
+    표 보기는 선택 세대(selection_epoch)를 올려 담기 목록을 기본 선택으로 한 새 표로 다시 그립니다.
+    """
+    for contest_id in st.session_state.get('visible_ids', []):
+        st.session_state[f"cb_{contest_id}"] = value
+    st.session_state['selection_epoch'] = st.session_state.get('selection_epoch', 0) + 1
+    st.session_state['grid_selected_ids'] = {}
+
+def select_visible_contests():
+    """전체 선택 버튼 콜백 - 현재 화면(페이지)의 공모전 담기"""
+    st.session_state['selected_ids'].update(st.session_state.get('visible_ids', []))
+    _set_visible_checkboxes(True)
+    st.rerun(["contest_list"] + SELECTION_FRAGMENTS)
+
+def select_filtered_contests():
+    """검색 결과 전체 선택 버튼 콜백 - 현재 기간/상금 조건에 맞는 공모전 모두 담기"""
+    st.session_state['selected_ids'].update(st.session_state.get('result_ids', []))
+    _set_visible_checkboxes(True)
+    st.rerun(["contest_list"] + SELECTION_FRAGMENTS)
+
+def clear_selected_contests():
+    """전체 해제 버튼 콜백"""
+    st.session_state['selected_ids'].clear()
+    _set_visible_checkboxes(False)
+    st.rerun(["contest_list"] + SELECTION_FRAGMENTS)
+
+def change_page(step):
+    """이전/다음 페이지 버튼 콜백"""
+    st.session_state['current_page'] += step
 
 def validate_inputs(keyword, from_date, to_date):
     """입력값 검증"""
@@ -80,9 +153,10 @@ def validate_inputs(keyword, from_date, to_date):
 
 def format_deadline(deadline):
     """마감일 포맷팅"""
-    if deadline is None:
+    if deadline is None or pd.isna(deadline):
         return "마감일 미정"
     
+    deadline = pd.Timestamp(deadline).date()
     days_left = (deadline - datetime.now().date()).days
     if days_left < 0:
         return f"{deadline.strftime('%Y.%m.%d')} (마감)"
@@ -103,8 +177,10 @@ def display_contest_card(contest, index):
     # 마감일 정보
     deadline_text = format_deadline(contest['마감일'])
     
-    # 고유한 키 생성 (링크 기반)
-    contest_key = f"contest_{hash(contest['링크'])}"
+    # 담기 체크박스 키 (링크로 만든 고정 ID 기반)
+    checkbox_key = f"cb_{contest['contest_id']}"
+    if checkbox_key not in st.session_state:
+        st.session_state[checkbox_key] = contest['contest_id'] in st.session_state['selected_ids']
     
     # 상금 정보
     prize = contest.get('상금', '상금 정보 없음')
@@ -135,9 +211,10 @@ def display_contest_card(contest, index):
     
     with row1_col2:
         # 마감일 색상 처리 (세련된 블루-그린 팔레트)
-        if contest['마감일'] and (contest['마감일'] - datetime.now().date()).days <= 7:
+        has_deadline = pd.notna(contest['마감일'])
+        if has_deadline and (pd.Timestamp(contest['마감일']).date() - datetime.now().date()).days <= 7:
             st.markdown(f"📅 **마감일:** <span style='color: #dc2626; font-weight: bold;'>{deadline_text}</span>", unsafe_allow_html=True)
-        elif contest['마감일']:
+        elif has_deadline:
             st.markdown(f"📅 **마감일:** <span style='color: #10b981; font-weight: bold;'>{deadline_text}</span>", unsafe_allow_html=True)
         else:
             st.markdown(f"📅 **마감일:** <span style='color: #6b7280; font-weight: bold;'>{deadline_text}</span>", unsafe_allow_html=True)
@@ -152,12 +229,11 @@ def display_contest_card(contest, index):
         
         with action_col1:
             # 체크박스 표시 (더 예쁜 라벨)
-            is_selected = st.checkbox(
+            st.checkbox(
                 "📂 담기", 
-                value=contest_key in st.session_state.get('selected_contests', set()),
-                key=f"cb_{contest_key}",
+                key=checkbox_key,
                 on_change=toggle_contest_selection,
-                args=(contest_key, contest)
+                args=(contest['contest_id'],)
             )
         
         with action_col2:
@@ -194,16 +270,70 @@ def display_contest_card(contest, index):
     
 
 
+def display_contest_grid(df, grid_key):
+    """전체 결과를 하나의 표로 표시 (스크롤은 브라우저에서 가상화, 행 선택으로 담기)
+    
+    표의 선택은 행 위치로 저장되므로 grid_key는 표시하는 결과(검색, 필터, 정렬)마다 달라야 합니다.
+    처음 그릴 때 담은 공모전의 행을 기본 선택으로 지정합니다.
+    """
+    contest_ids = df['contest_id'].to_numpy()
+    selected_rows = df.index[df['contest_id'].isin(st.session_state['selected_ids'])].tolist()
+    if grid_key not in st.session_state:
+        # 새로 그리는 표 - 기본 선택을 직전 표 선택으로 기록
+        st.session_state['grid_selected_ids'] = {grid_key: set(contest_ids[selected_rows].tolist())}
+    
+    view = df[['제목', '주최', '마감일', '기간', '상금', '상금_원', '링크']]
+    st.dataframe(
+        view,
+        column_config={
+            '제목': st.column_config.TextColumn("제목", width="large"),
+            '주최': st.column_config.TextColumn("주최", width="medium"),
+            '마감일': st.column_config.DateColumn("마감일", format="YYYY.MM.DD"),
+            '기간': st.column_config.TextColumn("기간"),
+            '상금': st.column_config.TextColumn("상금"),
+            '상금_원': st.column_config.NumberColumn("1등 상금(원)", format="localized"),
+            '링크': st.column_config.LinkColumn("링크", display_text="🚀 바로가기"),
+        },
+        hide_index=True,
+        use_container_width=True,
+        height=600,
+        on_select=partial(sync_grid_selection, grid_key, contest_ids),
+        selection_mode="multi-row",
+        selection_default={"selection": {"rows": selected_rows}},
+        key=grid_key,
+    )
+    st.caption("행 왼쪽의 체크박스로 담을 수 있고, 열 제목을 눌러 화면에서 바로 정렬할 수 있습니다.")
+
+def filter_by_prize(results: SortedContests) -> Tuple[SortedContests, Optional[Tuple[int, int]]]:
+    """상금 범위 슬라이더 (만원 단위) - 캐시된 결과에 금액 마스크를 적용, (결과, 선택한 범위) 반환"""
+    amounts = prize_column(results.df)
+    max_amount = int(-(-amounts.max() // 10_000)) if len(amounts) else 0
+    if max_amount <= 0:
+        return results, None
+    
+    low, high = st.slider(
+        "💰 1등 상금 범위 (만원)",
+        min_value=0,
+        max_value=max_amount,
+        value=(0, max_amount),
+        help="0만원을 포함하면 상금 정보가 없는 공모전도 함께 표시합니다",
+        key=f"prize_range_slider_{st.session_state.get('results_version', 0)}_{max_amount}"
+    )
+    if (low, high) == (0, max_amount):
+        return results, (low, high)
+    return results.subset((amounts >= low * 10_000) & (amounts <= high * 10_000)), (low, high)
+
+@st.fragment(key="statistics")
 def display_statistics(df):
     """통계 정보 표시"""
     if df.empty:
         return
     
     total_count = len(df)
-    urgent_count = len(df[df['마감일'].notna() & 
-                       (df['마감일'] <= datetime.now().date() + timedelta(days=7))])
-    upcoming_count = len(df[df['마감일'].notna() & 
-                         (df['마감일'] > datetime.now().date() + timedelta(days=7))])
+    deadlines = pd.to_datetime(df['마감일'], errors='coerce')
+    week_later = pd.Timestamp(datetime.now().date() + timedelta(days=7))
+    urgent_count = int((deadlines <= week_later).sum())
+    upcoming_count = int((deadlines > week_later).sum())
     
     # 메트릭 카드 스타일링
     st.markdown("""
@@ -265,7 +395,210 @@ def display_statistics(df):
         </div>
         """, unsafe_allow_html=True)
 
-def safe_crawl_with_progress(keyword, max_pages, from_date, to_date):
+@st.fragment(key="contest_list")
+def display_results_list(results: SortedContests):
+    """보기 방식/정렬/페이지를 적용한 공모전 목록 (fragment - 이 안의 조작은 목록만 다시 실행)
+    
+    정렬 순서는 results에 캐시되므로 페이지를 넘길 때는 필요한 행만 잘라 씁니다.
+    """
+    # 보기 방식 / 정렬 옵션
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        view_mode = st.radio(
+            "보기 방식",
+            ["카드", "표"],
+            horizontal=True,
+            help="표 보기는 전체 결과를 한 번에 스크롤해서 볼 수 있어 결과가 많을 때 빠릅니다",
+            key="view_mode_radio"
+        )
+    
+    with col2:
+        sort_option = st.selectbox(
+            "정렬 기준",
+            list(SORT_OPTIONS),
+            key="sort_option_select"
+        )
+    
+    # 페이지네이션 설정
+    items_per_page = 10
+    total_pages = (len(results) - 1) // items_per_page + 1
+    
+    # 기간 변경으로 결과가 줄어든 경우 마지막 페이지로 조정
+    st.session_state['current_page'] = min(st.session_state.get('current_page', 1), total_pages)
+    
+    # 표 보기는 페이지를 나누지 않고 전체 결과를 한 번에 전달 (스크롤은 브라우저에서 처리)
+    if view_mode == "표":
+        total_pages = 1
+    
+    if total_pages > 1:
+        current_page = st.session_state['current_page']
+        start_idx = (current_page - 1) * items_per_page
+        end_idx = start_idx + items_per_page
+        df_page = results.page(sort_option, start_idx, end_idx)
+        
+        # 현재 페이지 정보 표시
+        st.info(f"📄 {current_page}/{total_pages} 페이지 ({start_idx + 1}-{min(end_idx, len(results))}번째 공모전)")
+    else:
+        df_page = results.sorted(sort_option)
+        st.info(f"📄 전체 {len(results)}개 공모전")
+    
+    # 전체 선택 대상
+    st.session_state['visible_ids'] = df_page['contest_id'].tolist()
+    
+    # 공모전 목록 표시
+    if view_mode == "표":
+        grid_key = "_".join(map(str, (
+            "contest_grid", st.session_state.get('results_key', ''), sort_option,
+            st.session_state.get('selection_epoch', 0)
+        )))
+        display_contest_grid(df_page.reset_index(drop=True), grid_key)
+    else:
+        for idx, (_, contest) in enumerate(df_page.iterrows()):
+            display_contest_card(contest, idx)
+    
+    # 페이지네이션 (이전/다음 버튼)
+    if total_pages > 1:
+        st.markdown("---")
+        # 페이지 버튼들 (중앙 정렬)
+        col1, col2, col3, col4, col5 = st.columns([1, 1, 1, 1, 1])
+        
+        with col2:
+            st.button("◀️ 이전", disabled=st.session_state['current_page'] <= 1, key="prev_page_button",
+                      on_click=change_page, args=(-1,))
+        
+        with col3:
+            st.write(f"**{st.session_state['current_page']} / {total_pages}**")
+        
+        with col4:
+            st.button("다음 ▶️", disabled=st.session_state['current_page'] >= total_pages, key="next_page_button",
+                      on_click=change_page, args=(1,))
+
+@st.fragment(key="selection_summary")
+def display_selection_summary():
+    """결과 아래 담기 현황과 전체 선택/해제 버튼"""
+    selected_count = len(st.session_state['selected_ids'])
+    
+    if selected_count > 0:
+        st.success(f"✅ {selected_count}개 공모전이 선택되었습니다")
+    else:
+        st.info("🎯 관심있는 공모전을 '📌 담기'로 선택하면 이메일 발송이나 Excel 다운로드가 가능해요!")
+    
+    # 전체 선택/해제 버튼 (해제는 담은 공모전이 있을 때만)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.button("🔲 전체 선택", key="select_all_button", on_click=select_visible_contests,
+                  help="현재 화면의 공모전을 담습니다")
+    
+    with col2:
+        st.button("✅ 검색 결과 전체 선택", key="select_filtered_button", on_click=select_filtered_contests,
+                  help="현재 기간/상금 조건에 맞는 공모전을 모두 담습니다")
+    
+    if selected_count > 0:
+        with col3:
+            st.button("⬜ 전체 해제", key="clear_all_button", on_click=clear_selected_contests)
+
+def build_selection_excel(df) -> bytes:
+    """담은 공모전 Excel 파일 생성 (다운로드 버튼을 누를 때만 실행)"""
+    excel_buffer = io.BytesIO()
+    df.to_excel(excel_buffer, index=False, engine='openpyxl')
+    return excel_buffer.getvalue()
+
+@st.fragment(key="selection_actions")
+def display_selection_actions():
+    """사이드바 담기 목록 - 이메일 발송과 Excel 다운로드"""
+    selected_count = len(st.session_state['selected_ids'])
+    
+    if selected_count > 0:
+        st.success(f"✅ {selected_count}개 선택됨")
+        
+        # 이메일 발송
+        st.subheader("📧 이메일 발송")
+        receiver_email = st.text_input(
+            "이메일 주소",
+            placeholder="example@email.com",
+            help=f"선택된 {selected_count}개 공모전을 받을 이메일"
+        )
+        
+        if st.button(f" {selected_count}개 발송", use_container_width=True):
+            if receiver_email and '@' in receiver_email:
+                selected_df = selected_frame()
+                with st.spinner(" 이메일 발송 중..."):
+                    send_email_streamlit(selected_df, receiver_email)
+            else:
+                st.error("올바른 이메일을 입력하세요")
+        
+        # Excel 다운로드 (파일은 버튼을 누를 때 생성)
+        st.subheader("📊 Excel 다운로드")
+        st.download_button(
+            label=f" {selected_count}개 다운로드",
+            data=partial(build_selection_excel, selected_frame()),
+            file_name=f"선택된_공모전_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            on_click="ignore",
+            use_container_width=True
+        )
+    else:
+        st.info("📂 공모전을 선택하면 이메일 발송 및 Excel 다운로드가 가능합니다")
+
+@st.cache_resource
+def get_contest_store():
+    """세션 간 공유하는 공모전 저장소"""
+    return ContestStore()
+
+@st.cache_resource
+def get_prefetch_scheduler():
+    """추천 키워드 사전 수집 스레드 (서버 프로세스당 하나)"""
+    scheduler = PrefetchScheduler(store=get_contest_store())
+    scheduler.start()
+    return scheduler
+
+def select_recommended_keyword(keyword):
+    """추천 키워드 버튼 콜백 - 검색창에 반영하고 저장소 검색 실행"""
+    st.session_state['search_keyword'] = keyword
+    st.session_state['run_stored_search'] = True
+
+def get_filtered_results(from_date, to_date) -> SortedContests:
+    """기간 필터링 결과 (검색 결과, 기간, 날짜가 같으면 정렬 캐시와 함께 이전 결과 재사용)"""
+    memo_key = (st.session_state.get('results_version', 0), from_date, to_date, datetime.now().date())
+    memo = st.session_state.get('filtered_results')
+    if memo is None or memo[0] != memo_key:
+        raw_results = st.session_state['raw_results']
+        results = filter_contests(raw_results, from_date, to_date) if not raw_results.empty else raw_results
+        memo = (memo_key, SortedContests(results))
+        st.session_state['filtered_results'] = memo
+    return memo[1]
+
+def load_stored_contests(keyword, max_pages, live_fallback):
+    """저장소 전문 검색 (결과가 부족하거나 오래되면 live_fallback에 따라 크롤링)"""
+    try:
+        # 기간 필터링은 화면에서 적용
+        df = search_contests(
+            keyword,
+            max_pages=max_pages,
+            store=get_contest_store(),
+            live_fallback=live_fallback
+        )
+        return df, None
+    except Exception as e:
+        error_msg = f"저장소 검색 중 오류 발생: {str(e)}"
+        logger.error(f"{error_msg}\n{traceback.format_exc()}")
+        return pd.DataFrame(), error_msg
+
+@st.cache_data(ttl=CRAWL_CACHE_TTL, show_spinner=False)
+def cached_crawl(keyword, max_pages):
+    """키워드/페이지 수별 필터링 전 크롤링 결과 캐시 (기간을 바꿔도 다시 크롤링하지 않음)
+    
+    수집 실패는 예외로 전달되어 캐시되지 않습니다.
+    """
+    return crawl_wevity(
+        keyword=keyword,
+        max_pages=max_pages,
+        store=get_contest_store(),
+        apply_filter=False,
+        raise_errors=True
+    )
+
+def safe_crawl_with_progress(keyword, max_pages):
     """안전한 크롤링 with 진행상황 표시"""
     progress_placeholder = st.empty()
     
@@ -273,13 +606,8 @@ def safe_crawl_with_progress(keyword, max_pages, from_date, to_date):
         with progress_placeholder.container():
             st.info("🔄 크롤링을 시작합니다... 잠시만 기다려주세요.")
         
-        # 실제 크롤링 실행
-        df = crawl_wevity(
-            keyword=keyword,
-            max_pages=max_pages,
-            from_date=from_date,
-            to_date=to_date
-        )
+        # 실제 크롤링 실행 (같은 키워드/페이지 수는 캐시 사용)
+        df = cached_crawl(keyword.strip(), max_pages)
         
         progress_placeholder.empty()
         return df, None
@@ -290,52 +618,11 @@ def safe_crawl_with_progress(keyword, max_pages, from_date, to_date):
         logger.error(f"{error_msg}\n{traceback.format_exc()}")
         return pd.DataFrame(), error_msg
 
-def extract_prize_amount(prize_text):
-    """상금 텍스트에서 1등 상금액 추출"""
-    if not prize_text or prize_text == "상금 정보 없음":
-        return 0
-    
-    import re
-    
-    # 1등, 대상, 최우수상 등의 키워드와 함께 나오는 상금 우선 추출
-    first_prize_patterns = [
-        r'(?:1등|대상|최우수상|금상|우승).*?(\d+(?:,\d+)*)\s*만원',
-        r'(?:1등|대상|최우수상|금상|우승).*?(\d+(?:,\d+)*)\s*억원',
-        r'(?:1등|대상|최우수상|금상|우승).*?(\d+(?:,\d+)*)\s*원',
-    ]
-    
-    for pattern in first_prize_patterns:
-        match = re.search(pattern, prize_text)
-        if match:
-            amount = float(match.group(1).replace(',', ''))
-            if '만원' in pattern:
-                return amount * 10000
-            elif '억원' in pattern:
-                return amount * 100000000
-            else:
-                return amount
-    
-    # 1등 상금이 명시되지 않은 경우, 가장 큰 금액 추출
-    amounts = []
-    
-    # 억원 단위
-    for match in re.finditer(r'(\d+(?:,\d+)*(?:\.\d+)?)\s*억원?', prize_text):
-        amounts.append(float(match.group(1).replace(',', '')) * 100000000)
-    
-    # 만원 단위
-    for match in re.finditer(r'(\d+(?:,\d+)*(?:\.\d+)?)\s*만원?', prize_text):
-        amounts.append(float(match.group(1).replace(',', '')) * 10000)
-    
-    # 원 단위 (큰 금액만)
-    for match in re.finditer(r'(\d+(?:,\d+)*)\s*원', prize_text):
-        amount = float(match.group(1).replace(',', ''))
-        if amount >= 100000:  # 10만원 이상만
-            amounts.append(amount)
-    
-    # 가장 큰 금액 반환 (1등 상금일 가능성이 높음)
-    return max(amounts) if amounts else 0
-
 def main():
+    # 추천 키워드 사전 수집 시작 (여러 프로세스가 떠 있어도 저장소 잠금으로 한 곳에서만 수집)
+    if PREFETCH_ENABLED:
+        get_prefetch_scheduler()
+    
     # 헤더
     st.title("🏆 '위비티' 공모전 검색 대시보드")
     st.markdown("원하는 키워드와 기간으로 공모전 정보를 검색하고 관리하세요")
@@ -347,7 +634,6 @@ def main():
         # 키워드 입력
         keyword = st.text_input(
             "검색 키워드", 
-            value='공공데이터',
             help="검색하고 싶은 키워드를 입력하세요 (예: AI, 빅데이터, 디자인)",
             disabled=st.session_state.get('search_in_progress', False),
             key="search_keyword"
@@ -419,52 +705,30 @@ def main():
             key="search_button"
         )
         
+        # 저장소 검색 버튼 (이전에 수집한 공모전에서 바로 검색)
+        stored_button = st.button(
+            "💾 저장소에서 검색",
+            use_container_width=True,
+            disabled=len(errors) > 0 or st.session_state.get('search_in_progress', False),
+            help="이전에 수집한 공모전의 제목/주최/기간에서 검색합니다",
+            key="stored_search_button"
+        )
+        live_fallback = st.checkbox(
+            "결과가 부족하거나 오래되면 실시간 검색",
+            value=True,
+            key="live_fallback_checkbox"
+        )
+        last_crawl = get_contest_store().last_crawl(keyword) if keyword.strip() else None
+        if last_crawl:
+            st.caption(f"마지막 수집: {last_crawl['crawled_at'].strftime('%Y-%m-%d %H:%M')} ({last_crawl['result_count']}개)")
+        
         # 에러 메시지 표시
         if errors:
             for error in errors:
                 st.error(f"❌ {error}")
         
         # 선택된 공모전 관리 (사이드바에서)
-        selected_count = len(st.session_state.get('selected_contests', set()))
-        
-        if selected_count > 0:
-            st.success(f"✅ {selected_count}개 선택됨")
-            
-            # 이메일 발송
-            st.subheader("📧 이메일 발송")
-            receiver_email = st.text_input(
-                "이메일 주소",
-                placeholder="example@email.com",
-                help=f"선택된 {selected_count}개 공모전을 받을 이메일"
-            )
-            
-            if st.button(f" {selected_count}개 발송", use_container_width=True):
-                if receiver_email and '@' in receiver_email:
-                    selected_df = pd.DataFrame(list(st.session_state['contest_data'].values()))
-                    with st.spinner(" 이메일 발송 중..."):
-                        send_email_streamlit(selected_df, receiver_email)
-                else:
-                    st.error("올바른 이메일을 입력하세요")
-            
-            # Excel 다운로드
-            st.subheader("📊 Excel 다운로드")
-            try:
-                selected_df = pd.DataFrame(list(st.session_state['contest_data'].values()))
-                excel_buffer = io.BytesIO()
-                selected_df.to_excel(excel_buffer, index=False, engine='openpyxl')
-                excel_data = excel_buffer.getvalue()
-                
-                st.download_button(
-                    label=f" {selected_count}개 다운로드",
-                    data=excel_data,
-                    file_name=f"선택된_공모전_{datetime.now().strftime('%Y%m%d_%H%M')}.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    use_container_width=True
-                )
-            except Exception as e:
-                st.error(f"Excel 생성 오류: {e}")
-        else:
-            st.info("📂 공모전을 선택하면 이메일 발송 및 Excel 다운로드가 가능합니다")
+        display_selection_actions()
         
         # 도움말
         with st.expander("💡 사용 팁"):
@@ -484,7 +748,7 @@ def main():
         st.session_state['search_in_progress'] = True
         
         # 검색 실행
-        df, error = safe_crawl_with_progress(keyword, max_pages, from_date, to_date)
+        df, error = safe_crawl_with_progress(keyword, max_pages)
         
         st.session_state['search_in_progress'] = False
         
@@ -493,15 +757,35 @@ def main():
             st.info("잠시 후 다시 시도하거나, 다른 키워드로 검색해보세요.")
         else:
             # 세션 상태에 결과 저장
-            st.session_state['search_results'] = df
+            set_search_results(df)
+            st.session_state['input_keyword'] = keyword
+            st.session_state['search_date'] = datetime.now()
+            st.session_state['current_page'] = 1
+            
+            st.success(f"✅ 검색 완료! 총 {len(df)}개의 공모전을 수집했습니다.")
+    elif (stored_button or st.session_state.pop('run_stored_search', False)) and not errors:
+        with st.spinner("💾 저장소 검색 중..."):
+            df, error = load_stored_contests(keyword, max_pages, live_fallback)
+        
+        if error:
+            st.error(f"❌ 검색 실패: {error}")
+        else:
+            set_search_results(df)
             st.session_state['input_keyword'] = keyword
             st.session_state['search_date'] = datetime.now()
+            st.session_state['current_page'] = 1
             
-            st.success(f"✅ 검색 완료! 총 {len(df)}개의 공모전을 찾았습니다.")
+            st.success(f"✅ 저장소 검색 완료! 총 {len(df)}개의 공모전을 찾았습니다.")
+    
+    # 기간/제외 키워드 필터링 (캐시된 결과에 바로 적용하므로 기간을 바꿔도 다시 크롤링하지 않음)
+    raw_results = st.session_state['raw_results']
+    results = get_filtered_results(from_date, to_date)
+    if not raw_results.empty and results.df.empty:
+        st.warning("현재 기간 설정에 맞는 공모전이 없습니다. 기간을 조정해보세요.")
     
     # 검색 결과 표시
-    if not st.session_state['search_results'].empty:
-        df = st.session_state['search_results']
+    if not results.df.empty:
+        df = results.df
         keyword = st.session_state.get('input_keyword', '공공데이터')
         search_date = st.session_state.get('search_date', datetime.now())
         
@@ -509,98 +793,25 @@ def main():
         st.subheader("📊 검색 결과")
         st.info(f"키워드: **{keyword}** | 검색시간: {search_date.strftime('%Y-%m-%d %H:%M')} | 총 {len(df)}건")
         
-        # 통계 정보
-        display_statistics(df)
-        
-        # 정렬 옵션
-        col1, col2 = st.columns([3, 1])
-        with col2:
-            sort_options = ["마감 임박순", "신규 등록순", "제목 순"]
-            
-            sort_option = st.selectbox(
-                "정렬 기준",
-                sort_options,
-                key="sort_option_select"
-            )
-        
-        # 데이터 정렬
-        if sort_option == "마감 임박순":
-            # 마감일이 가까운 순으로 정렬 (오늘에 가까운 것부터)
-            df_sorted = df.sort_values('마감일', na_position='last')
-        elif sort_option == "신규 등록순":
-            # 마감일이 먼 순으로 정렬 (최근 등록된 것들이 보통 마감일이 멀음)
-            df_sorted = df.sort_values('마감일', ascending=False, na_position='first')
-        else:
-            df_sorted = df.sort_values('제목')
-        
-        # 페이지네이션 설정
-        items_per_page = 10
-        total_pages = (len(df_sorted) - 1) // items_per_page + 1
+        # 상금 범위 필터 (캐시된 정렬 순서를 그대로 추려 씀)
+        results, prize_range = filter_by_prize(results)
+        st.session_state['result_ids'] = results.df['contest_id'].tolist()  # 검색 결과 전체 선택 대상
+        # 표 보기 위젯 키에 쓰는 결과 식별자 (검색/기간/상금 범위가 바뀌면 새 표로 그림)
+        st.session_state['results_key'] = "_".join(map(str, (
+            st.session_state.get('results_version', 0), from_date, to_date, prize_range, datetime.now().date()
+        )))
         
-        if total_pages > 1:
-            current_page = st.session_state.get('current_page', 1)
-            start_idx = (current_page - 1) * items_per_page
-            end_idx = start_idx + items_per_page
-            df_page = df_sorted.iloc[start_idx:end_idx]
-            
-            # 현재 페이지 정보 표시
-            st.info(f"📄 {current_page}/{total_pages} 페이지 ({start_idx + 1}-{min(end_idx, len(df_sorted))}번째 공모전)")
+        if results.df.empty:
+            st.warning("현재 상금 범위에 맞는 공모전이 없습니다. 범위를 조정해보세요.")
         else:
-            df_page = df_sorted
-            st.info(f"📄 전체 {len(df_sorted)}개 공모전")
-        
-        # 공모전 목록 표시
-        for idx, (_, contest) in enumerate(df_page.iterrows()):
-            display_contest_card(contest, idx)
-        
-        # 페이지네이션 (이전/다음 버튼)
-        if total_pages > 1:
-            st.markdown("---")
-            # 페이지 버튼들 (중앙 정렬)
-            col1, col2, col3, col4, col5 = st.columns([1, 1, 1, 1, 1])
-            
-            with col2:
-                if st.button("◀️ 이전", disabled=st.session_state['current_page'] <= 1, key="prev_page_button"):
-                    st.session_state['current_page'] -= 1
-                    st.rerun()
+            # 통계 정보
+            display_statistics(results.df)
             
-            with col3:
-                st.write(f"**{st.session_state['current_page']} / {total_pages}**")
+            # 공모전 목록 (보기 방식/정렬/페이지 변경은 목록만 다시 그림)
+            display_results_list(results)
             
-            with col4:
-                if st.button("다음 ▶️", disabled=st.session_state['current_page'] >= total_pages, key="next_page_button"):
-                    st.session_state['current_page'] += 1
-                    st.rerun()
-        
-        # 선택된 공모전 관리 (간단하게)
-        selected_count = len(st.session_state.get('selected_contests', set()))
-        
-        if selected_count > 0:
-            st.success(f"✅ {selected_count}개 공모전이 선택되었습니다")
-            
-            # 전체 선택/해제 버튼
-            col1, col2 = st.columns(2)
-            with col1:
-                if st.button("🔲 전체 선택", key="select_all_button"):
-                    selected_contests = st.session_state.get('selected_contests', set())
-                    contest_data = st.session_state.get('contest_data', {})
-                    
-                    for idx, (_, contest) in enumerate(df_page.iterrows()):
-                        contest_key = f"contest_{hash(contest['링크'])}"
-                        selected_contests.add(contest_key)
-                        contest_data[contest_key] = contest.to_dict()
-                    
-                    st.session_state['selected_contests'] = selected_contests
-                    st.session_state['contest_data'] = contest_data
-                    st.rerun()
-            
-            with col2:
-                if st.button("⬜ 전체 해제", key="clear_all_button"):
-                    st.session_state['selected_contests'] = set()
-                    st.session_state['contest_data'] = {}
-                    st.rerun()
-        else:
-            st.info("🎯 관심있는 공모전을 '📌 담기'로 선택하면 이메일 발송이나 Excel 다운로드가 가능해요!")
+            # 담기 현황 (담기 변경은 이 부분과 사이드바 담기 목록만 다시 그림)
+            display_selection_summary()
     
     else:
         # 초기 화면
@@ -613,7 +824,9 @@ def main():
             st.markdown("""
             - 🔍 **키워드 검색**: 원하는 주제의 공모전 검색
             - 📅 **기간 필터**: 마감일 기준 맞춤 필터링
-            - 🎯 **정렬 옵션**: 마감임박순, 신규등록순, 제목순            
+            - 🎯 **정렬 옵션**: 마감임박순, 신규등록순, 제목순, 상금 높은순
+            - 💰 **상금 범위**: 1등 상금액으로 필터링
+            - 📋 **표 보기**: 많은 결과를 한 화면에서 스크롤
             """)
         
         with col2:
@@ -624,22 +837,19 @@ def main():
             """)
         
         st.subheader("🎯 추천 키워드")
-        st.caption("실제 위비티에서 검색 결과가 많이 나오는 키워드들입니다")
+        st.caption("실제 위비티에서 검색 결과가 많이 나오는 키워드들입니다 (백그라운드에서 주기적으로 미리 수집)")
         
         # 더 실용적이고 유의미한 키워드들
-        keywords = [
-            "공공데이터", "AI", "빅데이터", "스타트업", 
-            "디자인", "영상", "사진", "아이디어",
-            "창업", "대학생", "청년", "혁신"
-        ]
+        keywords = prefetch_keywords()
+        store = get_contest_store()
         
         cols = st.columns(4)
         for i, kw in enumerate(keywords):
             col = cols[i % 4]
             with col:
-                if st.button(f"🏷️ {kw}", key=f"keyword_{i}"):
-                    st.session_state['selected_keyword'] = kw
-                    st.rerun()
+                st.button(f"🏷️ {kw}", key=f"keyword_{i}", on_click=select_recommended_keyword, args=(kw,))
+                last_crawl = store.last_crawl(kw)
+                st.caption(format_data_age(last_crawl['crawled_at'] if last_crawl else None))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file